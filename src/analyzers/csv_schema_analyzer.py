@@ -5,28 +5,89 @@ Supports dynamic depth paths (1-8 levels) with flexible element/attribute target
 """
 
 import argparse
+import contextlib
 import csv
+import re
+from concurrent.futures import ProcessPoolExecutor
 import sys
 import os
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple, Union
 import logging
 from dataclasses import dataclass, field
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import track
-from rich import print as rprint
 import json
 
 # Add utils directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'utils'))
 
-from src.parsers.multi_file_xsd_parser import MultiFileXSDParser
+# Rich and the XSD parser are imported where they are used, so that
+# `--help` and argument errors don't pay their import cost
+if TYPE_CHECKING:
+    from rich.console import Console
+    from src.parsers.multi_file_xsd_parser import MultiFileXSDParser
 
-console = Console()
+
+class _LazyConsole:
+    """Placeholder that creates the Rich console on first use and delegates to it."""
+    
+    def __init__(self):
+        self._console: Optional['Console'] = None
+    
+    def __getattr__(self, name: str) -> Any:
+        if self._console is None:
+            from rich.console import Console
+            self._console = Console()
+        return getattr(self._console, name)
+
+
+console = _LazyConsole()
 logger = logging.getLogger(__name__)
 
+# Matches Rich markup tags such as [bold green], [/bold green] and [/], using Rich's
+# tag grammar (a tag starts with a lowercase letter, '#', '@' or '/'), so bracketed
+# text like reqs[2024].csv or book[1] is left alone as Rich itself would
+_MARKUP_RE = re.compile(r'\[(?:/|/?[a-z#@][^\[\]]*)\]')
+
+
+def _strip_markup(text: str) -> str:
+    """Remove Rich markup tags from a string."""
+    return _MARKUP_RE.sub('', text)
+
+
+class PlainConsole:
+    """
+    Drop-in replacement for the Rich console that writes plain text.
+    Used by --no-rich to skip markup parsing and ANSI rendering in automation.
+    """
+    
+    def __init__(self):
+        self._fallback: Optional['Console'] = None
+    
+    def print(self, *objects: Any, **kwargs: Any) -> None:
+        """Print strings with markup stripped; render other objects without color."""
+        if all(isinstance(obj, str) for obj in objects):
+            print(*(_strip_markup(obj) for obj in objects),
+                  sep=kwargs.get('sep', ' '), end=kwargs.get('end', '\n'))
+            return
+        
+        # Tables and panels still need Rich to lay them out
+        if self._fallback is None:
+            from rich.console import Console
+            self._fallback = Console(no_color=True, highlight=False)
+        self._fallback.print(*objects, **kwargs)
+    
+    def status(self, *args: Any, **kwargs: Any):
+        """No spinner in plain mode."""
+        return contextlib.nullcontext()
+
+
+def _progress(sequence, description: str, total: Optional[int] = None):
+    """Wrap a sequence in a Rich progress bar unless plain output is active."""
+    if isinstance(console, PlainConsole):
+        return sequence
+    from rich.progress import track
+    return track(sequence, description=description, total=total)
+
 @dataclass
 class SchemaRequirement:
     """Represents a single schema requirement from CSV."""
@@ -82,10 +143,15 @@ class CSVSchemaAnalyzer:
         """
         self.xsd_files = [Path(f) for f in xsd_files]
         self.csv_file = Path(csv_file)
+        # Display strings used by the reports, computed once
+        self._xsd_file_strs = [str(f) for f in self.xsd_files]
+        self._xsd_files_str = ", ".join(self._xsd_file_strs)
+        self._csv_file_str = str(self.csv_file)
         self.requirements: List[SchemaRequirement] = []
         self.results: List[AnalysisResult] = []
-        self.parser: Optional[MultiFileXSDParser] = None
+        self.parser: Optional['MultiFileXSDParser'] = None
         self.schema_data: Optional[Dict[str, Any]] = None
+        self._file_lookups: Optional[List[Tuple[str, Dict[str, Any], Dict[str, Any], Dict[str, Any]]]] = None
         
         # Validate input files
         for xsd_file in self.xsd_files:
@@ -152,6 +218,8 @@ class CSVSchemaAnalyzer:
     
     def load_xsd_schemas(self) -> None:
         """Load and parse XSD schemas."""
+        from src.parsers.multi_file_xsd_parser import MultiFileXSDParser
+        
         console.print(f"[bold blue]Loading {len(self.xsd_files)} XSD file(s)...[/bold blue]")
         
         # Use multi-file parser with the first file as main
@@ -164,6 +232,7 @@ class CSVSchemaAnalyzer:
         
         with console.status("[bold green]Parsing XSD schemas..."):
             self.schema_data = self.parser.parse()
+        self._file_lookups = None
         
         # If we have multiple XSD files that aren't related via imports/includes,
         # we'll need to parse them separately and merge the data
@@ -228,27 +297,9 @@ class CSVSchemaAnalyzer:
         target_attribute = requirement.attribute
         
         # Search through all parsed files
-        for file_name, file_data in self.schema_data.get('files', {}).items():
+        for file_name, elements, global_elements, complex_types in self._get_file_lookups():
             logger.debug(f"Searching in file: {file_name}")
-            
-            # Get elements and complex types
-            elements = file_data.get('elements', {})
-            if isinstance(elements, list):
-                elements_dict = {}
-                for elem in elements:
-                    if isinstance(elem, dict) and 'name' in elem:
-                        elements_dict[elem['name']] = elem
-                elements = elements_dict
-            
-            global_elements = file_data.get('global_elements', {})
-            if isinstance(global_elements, list):
-                global_elements_dict = {}
-                for elem in global_elements:
-                    if isinstance(elem, dict) and 'name' in elem:
-                        global_elements_dict[elem['name']] = elem
-                global_elements = global_elements_dict
-            
-            complex_types = file_data.get('complex_types', {})
+            file_data = self.schema_data['files'][file_name]
             
             # Try to find the path starting from root elements
             for element_name, element_data in elements.items():
@@ -264,6 +315,36 @@ class CSVSchemaAnalyzer:
         
         return False, None, None
     
+    def _get_file_lookups(self) -> List[Tuple[str, Dict[str, Any], Dict[str, Any], Dict[str, Any]]]:
+        """
+        Get per-file name lookups for elements, global elements and complex types.
+        
+        Built once per loaded schema and reused by every requirement, instead of
+        re-indexing element lists on each search.
+        """
+        if self._file_lookups is None:
+            self._file_lookups = []
+            for file_name, file_data in self.schema_data.get('files', {}).items():
+                self._file_lookups.append((
+                    file_name,
+                    self._index_by_name(file_data.get('elements', {})),
+                    self._index_by_name(file_data.get('global_elements', {})),
+                    file_data.get('complex_types', {})
+                ))
+        return self._file_lookups
+    
+    @staticmethod
+    def _index_by_name(elements: Union[Dict[str, Any], List[Any]]) -> Dict[str, Any]:
+        """Convert a list of element dicts into a dict keyed by element name."""
+        if not isinstance(elements, list):
+            return elements
+        
+        elements_dict = {}
+        for elem in elements:
+            if isinstance(elem, dict) and 'name' in elem:
+                elements_dict[elem['name']] = elem
+        return elements_dict
+    
     def _find_target_element(self, target_path: List[str], target_attribute: Optional[str], 
                            current_path: List[str], element_data: Dict[str, Any], 
                            complex_types: Dict[str, Any], file_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -466,20 +547,45 @@ class CSVSchemaAnalyzer:
         
         return result
     
-    def analyze_all_requirements(self) -> None:
-        """Analyze all loaded requirements against the schemas."""
+    def analyze_all_requirements(self, jobs: int = 1) -> None:
+        """
+        Analyze all loaded requirements against the schemas.
+        
+        Args:
+            jobs: Number of worker processes (1 analyzes in-process, 0 uses all CPUs)
+        """
         console.print("[bold blue]Analyzing requirements against schemas...[/bold blue]")
         
         self.results = []
         
-        for requirement in track(self.requirements, description="Analyzing requirements..."):
-            result = self.analyze_requirement(requirement)
-            self.results.append(result)
+        if jobs == 0:
+            jobs = os.cpu_count() or 1
+        jobs = min(jobs, len(self.requirements))
+        
+        if jobs <= 1:
+            for requirement in _progress(self.requirements, "Analyzing requirements..."):
+                result = self.analyze_requirement(requirement)
+                self.results.append(result)
+        else:
+            # Requirements are independent, so shard them across processes.
+            # Each worker receives the parsed schema data once via the initializer.
+            chunksize = max(1, len(self.requirements) // (jobs * 4))
+            with ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=_init_worker,
+                initargs=(self._xsd_file_strs, self._csv_file_str, self.schema_data)
+            ) as executor:
+                results = executor.map(_analyze_in_worker, self.requirements, chunksize=chunksize)
+                for result in _progress(results, "Analyzing requirements...", total=len(self.requirements)):
+                    self.results.append(result)
         
         console.print(f"[bold green]✓[/bold green] Analysis complete")
     
     def generate_console_report(self) -> None:
         """Generate a detailed console report of the analysis."""
+        from rich.panel import Panel
+        from rich.table import Table
+        
         if not self.results:
             console.print("[yellow]No analysis results to display[/yellow]")
             return
@@ -578,8 +684,8 @@ class CSVSchemaAnalyzer:
         report_data = {
             'analysis_summary': {
                 'total_requirements': len(self.requirements),
-                'xsd_files': [str(f) for f in self.xsd_files],
-                'csv_file': str(self.csv_file),
+                'xsd_files': list(self._xsd_file_strs),
+                'csv_file': self._csv_file_str,
                 'status_counts': {}
             },
             'requirements': [],
@@ -630,53 +736,78 @@ class CSVSchemaAnalyzer:
     
     def generate_text_report(self, output_path: str) -> None:
         """Generate a text report of the analysis."""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("CSV Schema Analysis Report\n")
-            f.write("=" * 50 + "\n\n")
-            
-            f.write(f"XSD Files Analyzed: {', '.join(str(f) for f in self.xsd_files)}\n")
-            f.write(f"CSV Requirements File: {self.csv_file}\n")
-            f.write(f"Total Requirements: {len(self.requirements)}\n\n")
-            
-            # Status summary
-            status_counts = {}
-            for result in self.results:
-                status_counts[result.status] = status_counts.get(result.status, 0) + 1
+        # Assemble the report in memory and write it with a single call;
+        # large requirement sets otherwise spend their time in per-line writes
+        parts = []
+        out = parts.append
+        
+        out("CSV Schema Analysis Report\n")
+        out("=" * 50 + "\n\n")
+        
+        out(f"XSD Files Analyzed: {self._xsd_files_str}\n")
+        out(f"CSV Requirements File: {self._csv_file_str}\n")
+        out(f"Total Requirements: {len(self.requirements)}\n\n")
+        
+        # Group results by status in one pass
+        results_by_status: Dict[str, List[AnalysisResult]] = {}
+        for result in self.results:
+            results_by_status.setdefault(result.status, []).append(result)
+        
+        out("Status Summary:\n")
+        out("-" * 20 + "\n")
+        for status, status_results in results_by_status.items():
+            count = len(status_results)
+            percentage = (count / len(self.results)) * 100
+            out(f"{status.upper()}: {count} ({percentage:.1f}%)\n")
+        out("\n")
+        
+        # Detailed results
+        for status in ['found', 'mismatch', 'missing', 'error']:
+            status_results = results_by_status.get(status)
+            if not status_results:
+                continue
             
-            f.write("Status Summary:\n")
-            f.write("-" * 20 + "\n")
-            for status, count in status_counts.items():
-                percentage = (count / len(self.results)) * 100
-                f.write(f"{status.upper()}: {count} ({percentage:.1f}%)\n")
-            f.write("\n")
+            out(f"{status.upper()} REQUIREMENTS ({len(status_results)})\n")
+            out("-" * 40 + "\n")
             
-            # Detailed results
-            for status in ['found', 'mismatch', 'missing', 'error']:
-                status_results = [r for r in self.results if r.status == status]
-                if not status_results:
-                    continue
-                
-                f.write(f"{status.upper()} REQUIREMENTS ({len(status_results)})\n")
-                f.write("-" * 40 + "\n")
+            for result in status_results:
+                req = result.requirement
+                out(f"ID: {req.id}\n")
+                out(f"Path: {req.get_target_path()}\n")
+                out(f"Description: {req.description}\n")
                 
-                for result in status_results:
-                    req = result.requirement
-                    f.write(f"ID: {req.id}\n")
-                    f.write(f"Path: {req.get_target_path()}\n")
-                    f.write(f"Description: {req.description}\n")
-                    
-                    if result.found_in_file:
-                        f.write(f"Found in: {result.found_in_file}\n")
-                    if result.actual_type:
-                        f.write(f"Actual type: {result.actual_type}\n")
-                    if result.issues:
-                        f.write(f"Issues: {'; '.join(result.issues)}\n")
-                    if result.suggestions:
-                        f.write(f"Suggestions: {'; '.join(result.suggestions)}\n")
-                    f.write("\n")
+                if result.found_in_file:
+                    out(f"Found in: {result.found_in_file}\n")
+                if result.actual_type:
+                    out(f"Actual type: {result.actual_type}\n")
+                if result.issues:
+                    out(f"Issues: {'; '.join(result.issues)}\n")
+                if result.suggestions:
+                    out(f"Suggestions: {'; '.join(result.suggestions)}\n")
+                out("\n")
+        
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write("".join(parts))
         
         console.print(f"[bold green]✓[/bold green] Text report saved: {output_path}")
 
+
+# Per-process analyzer used by worker processes in analyze_all_requirements
+_worker_analyzer: Optional[CSVSchemaAnalyzer] = None
+
+
+def _init_worker(xsd_files: List[str], csv_file: str, schema_data: Dict[str, Any]) -> None:
+    """Build the worker's analyzer once so schema data is not re-sent per requirement."""
+    global _worker_analyzer
+    _worker_analyzer = CSVSchemaAnalyzer(xsd_files, csv_file)
+    _worker_analyzer.schema_data = schema_data
+
+
+def _analyze_in_worker(requirement: SchemaRequirement) -> AnalysisResult:
+    """Analyze a single requirement inside a worker process."""
+    return _worker_analyzer.analyze_requirement(requirement)
+
+
 def main():
     """Main entry point for the CSV schema analyzer."""
     parser = argparse.ArgumentParser(
@@ -687,6 +818,7 @@ Examples:
   %(prog)s requirements.csv schema.xsd
   %(prog)s requirements.csv schema1.xsd schema2.xsd schema3.xsd --output-dir ./reports
   %(prog)s requirements.csv *.xsd --formats json text --verbose
+  %(prog)s requirements.csv schema.xsd --formats json --no-rich
 
 CSV Format (Dynamic Depth Structure):
   id,xpath,description,level1,level2,level3,level4,level5,level6,level7,level8,attribute,expected_type,required,validation_rules,business_purpose
@@ -714,9 +846,24 @@ CSV Format (Dynamic Depth Structure):
         action='store_true',
         help='Enable verbose logging'
     )
+    parser.add_argument(
+        '--no-rich',
+        action='store_true',
+        help='Write plain text output without Rich markup or colors (faster for automation)'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Worker processes for requirement analysis (default: 1, 0 = all CPUs)'
+    )
     
     args = parser.parse_args()
     
+    if args.no_rich:
+        global console
+        console = PlainConsole()
+    
     if args.verbose:
         logging.basicConfig(level=logging.DEBUG)
         logger.setLevel(logging.DEBUG)
@@ -727,6 +874,8 @@ CSV Format (Dynamic Depth Structure):
         # Create output directory
         output_dir = Path(args.output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
+        json_path = os.fspath(output_dir / 'csv_schema_analysis.json')
+        text_path = os.fspath(output_dir / 'csv_schema_analysis.txt')
         
         # Initialize analyzer
         console.print("[dim]Initializing analyzer...[/dim]")
@@ -741,19 +890,17 @@ CSV Format (Dynamic Depth Structure):
         
         # Perform analysis
         console.print("[dim]Performing analysis...[/dim]")
-        analyzer.analyze_all_requirements()
+        analyzer.analyze_all_requirements(jobs=args.jobs)
         
         # Generate reports
         if 'console' in args.formats:
             analyzer.generate_console_report()
         
         if 'json' in args.formats:
-            json_path = output_dir / 'csv_schema_analysis.json'
-            analyzer.generate_json_report(str(json_path))
+            analyzer.generate_json_report(json_path)
         
         if 'text' in args.formats:
-            text_path = output_dir / 'csv_schema_analysis.txt'
-            analyzer.generate_text_report(str(text_path))
+            analyzer.generate_text_report(text_path)
         
         console.print(f"\n[bold green]✓ Analysis complete![/bold green]")
         if args.formats != ['console']:
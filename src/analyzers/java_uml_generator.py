@@ -13,9 +13,11 @@ This tool analyzes XSD files and generates Java UML class diagrams, showing:
 import argparse
 import sys
 import os
-import json
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, List, Set, Any, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Iterator, List, Set, Any, Optional, Tuple, Union
 import logging
 from dataclasses import dataclass, field
 
@@ -24,13 +26,194 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from src.parsers.multi_file_xsd_parser import MultiFileXSDParser
 from src.parsers.xsd_parser import XSDParser
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import track
-from rich import print as rprint
+from src.cli_utils import configure_logging, dump_json, expand_xsd_paths
 
-@dataclass
+# Rich is imported where it is used, keeping CLI start-up and non-interactive use light
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Translation tables for single-character substitutions, applied in one C-level pass
+_DASH_TO_UNDER = str.maketrans('-', '_')  # '-' and '_' both separate words in XSD names
+_DASH_STRIP = str.maketrans('', '', '-')
+_ENUM_CONSTANT_TABLE = str.maketrans({'-': '_', ' ': '_'})
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10; older
+# interpreters, which the docs still support, get plain dataclasses
+_DATACLASS_SLOTS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@lru_cache(maxsize=4096)
+def _pascal_case(xsd_name: str) -> str:
+    """Convert an XSD name to PascalCase, dropping any namespace prefix ('' if nothing is left)"""
+    # Remove namespace prefix
+    _, sep, local_name = xsd_name.partition(':')
+    if sep:
+        xsd_name = local_name
+        
+    return ''.join(part.capitalize() for part in xsd_name.translate(_DASH_TO_UNDER).split('_') if part.strip())
+
+@lru_cache(maxsize=4096)
+def _camel_case(xsd_name: str) -> str:
+    """Convert an XSD name to camelCase, dropping any namespace prefix"""
+    if not xsd_name:
+        return 'unnamed'
+        
+    # Remove namespace prefix
+    _, sep, local_name = xsd_name.partition(':')
+    if sep:
+        xsd_name = local_name
+        
+    if not xsd_name:
+        return 'unnamed'
+        
+    parts = xsd_name.translate(_DASH_TO_UNDER).split('_')
+    return parts[0].lower() + ''.join(part.capitalize() for part in parts[1:])
+
+@lru_cache(maxsize=1024)
+def _namespace_package(namespace: str) -> str:
+    """Convert a non-empty XSD namespace to a Java package name"""
+    # Extract domain from namespace
+    if '://' in namespace:
+        namespace = namespace.split('://', 1)[1]
+        
+    # Convert to package format
+    parts = namespace.replace('/', '.').split('.')
+    # Reverse domain parts
+    if len(parts) > 1:
+        parts = list(reversed(parts[:2])) + parts[2:]
+        
+    return sys.intern('.'.join(part.lower().translate(_DASH_STRIP) for part in parts if part))
+
+# Keys _extract_documentation looks at; most elements carry none of them
+_DOC_KEYS = frozenset({
+    'documentation', 'doc', 'description',
+    'annotation', 'xsd:annotation',
+    'restriction', 'xsd:restriction',
+})
+
+# Java imports needed by attribute types in generated classes
+_TYPE_IMPORTS: Dict[str, Tuple[str, ...]] = {
+    'LocalDate': ('import java.time.LocalDate;',),
+    'LocalDateTime': ('import java.time.LocalDateTime;',),
+    'LocalTime': ('import java.time.LocalTime;',),
+    'BigDecimal': ('import java.math.BigDecimal;',),
+    'URI': ('import java.net.URI;',),
+}
+_LIST_IMPORTS = ('import java.util.List;', 'import java.util.ArrayList;')
+
+# XSD type names with these endings are mapped to generated classes
+_CLASS_TYPE_SUFFIXES = ('Type', 'type')
+
+# UML visibility marker per Java visibility; anything else is shown as private
+_UML_VISIBILITY = {'public': '+'}
+
+# Arrow per relationship type; anything unknown is drawn as an association
+_PLANTUML_ARROWS = {
+    'inheritance': '--|>',
+    'composition': '*--',
+    'aggregation': 'o--',
+    'association': '-->'
+}
+_MERMAID_ARROWS = {
+    'inheritance': '<|--',
+    'composition': '*--',
+    'aggregation': 'o--',
+    'association': '-->'
+}
+
+@lru_cache(maxsize=1024)
+def _java_imports(types: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Return the sorted import lines for a class whose attributes have these types"""
+    imports = set()
+    for t in types:
+        if t.startswith('List<'):
+            imports.update(_LIST_IMPORTS)
+        elif t in _TYPE_IMPORTS:
+            imports.update(_TYPE_IMPORTS[t])
+    return tuple(sorted(imports))
+
+# (is_list, multiplicity label) per maxOccurs value, filled in as new values appear
+_MULTIPLICITY_CACHE: Dict[str, Tuple[bool, str]] = {
+    '1': (False, '1'),
+    'unbounded': (True, '1..*'),
+}
+
+def _multiplicity(max_occurs: str) -> Tuple[bool, str]:
+    """Return whether a maxOccurs value makes a list, and its UML multiplicity label"""
+    cached = _MULTIPLICITY_CACHE.get(max_occurs)
+    if cached is None:
+        is_list = isinstance(max_occurs, str) and max_occurs.isdigit() and int(max_occurs) > 1
+        cached = _MULTIPLICITY_CACHE[max_occurs] = (is_list, f"1..{max_occurs}")
+    return cached
+
+def _annotation_documentation(annotation: Any) -> Optional[str]:
+    """Return the documentation text of an annotation dict, or None if it has none"""
+    if isinstance(annotation, dict):
+        if 'documentation' in annotation:
+            return str(annotation['documentation']).strip()
+        if 'doc' in annotation:
+            return str(annotation['doc']).strip()
+    return None
+
+def _normalize_elements(items: Union[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Return elements/attributes as a list of dicts, converting the older name-keyed dict format"""
+    if isinstance(items, dict):
+        return [{**info, 'name': name} for name, info in items.items()]
+    return items
+
+@lru_cache(maxsize=4096)
+def _accessor_names(field_name: str) -> Tuple[str, str]:
+    """Return the (getter, setter) method names for a field, keeping its camelCase"""
+    cap = field_name[:1].upper() + field_name[1:]
+    return f'get{cap}', f'set{cap}'
+
+def _element_field(name: str, java_type: str, documentation: str, min_occurs: str, max_occurs: str) -> Dict[str, Any]:
+    """Build the attribute dict for a field generated from a child XSD element"""
+    return {
+        'name': sys.intern(name),
+        'type': sys.intern(java_type),
+        'visibility': 'private',
+        'documentation': documentation,
+        'min_occurs': min_occurs,
+        'max_occurs': max_occurs
+    }
+
+def _attribute_field(name: str, java_type: str, documentation: str, required: bool) -> Dict[str, Any]:
+    """Build the attribute dict for a field generated from an XSD attribute"""
+    return {
+        'name': sys.intern(name),
+        'type': sys.intern(java_type),
+        'visibility': 'private',
+        'documentation': documentation,
+        'is_attribute': True,
+        'required': required
+    }
+
+def _enum_constant(name: str, enum_type: str) -> Dict[str, Any]:
+    """Build the attribute dict for an enum constant"""
+    return {
+        'name': sys.intern(name),
+        'type': sys.intern(enum_type),
+        'visibility': 'public',
+        'is_static': True,
+        'is_final': True
+    }
+
+# Below this many Java files, save_outputs writes them serially
+_MIN_PARALLEL_WRITES = 8
+
+def _write_java_file(item: Tuple[Path, str]) -> None:
+    """Write one generated Java source file"""
+    full_path, java_code = item
+    full_path.write_text(java_code, encoding='utf-8')
+
+def _parse_xsd_file(xsd_file: str) -> Tuple[str, Optional[Dict[str, Any]], Optional[str]]:
+    """Parse one XSD file, returning (path, structure, error); runs in worker processes"""
+    try:
+        return xsd_file, XSDParser(xsd_file).parse(), None
+    except Exception as e:
+        return xsd_file, None, str(e)
+
+@dataclass(**_DATACLASS_SLOTS)
 class JavaClass:
     """Represents a Java class derived from XSD complex type"""
     name: str
@@ -43,8 +226,28 @@ class JavaClass:
     is_abstract: bool = False
     documentation: str = ""
     xsd_type: str = "complex"  # complex, simple, element
+    _columns: Optional[Tuple[Tuple[Any, ...], ...]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def attribute_columns(self) -> Tuple[Tuple[Any, ...], ...]:
+        """Return (names, types, visibility markers, static-final flags, getters, setters) as parallel tuples"""
+        columns = self._columns
+        # Attributes are only ever appended, so a length change means the cache is stale
+        if columns is None or len(columns[0]) != len(self.attributes):
+            attrs = self.attributes
+            names = tuple(a['name'] for a in attrs)
+            accessors = [_accessor_names(n) for n in names]
+            columns = (
+                names,
+                tuple(a['type'] for a in attrs),
+                tuple(_UML_VISIBILITY.get(a['visibility'], '-') for a in attrs),
+                tuple(bool(a.get('is_static') and a.get('is_final')) for a in attrs),
+                tuple(getter for getter, _ in accessors),
+                tuple(setter for _, setter in accessors),
+            )
+            self._columns = columns
+        return columns
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Relationship:
     """Represents relationships between Java classes"""
     from_class: str
@@ -56,19 +259,36 @@ class Relationship:
 class JavaUMLGenerator:
     """Generates Java UML diagrams from XSD schemas"""
     
+    # Performance note: the hot paths here are plain dict lookups and string
+    # formatting, with no numeric kernels. JIT tools such as Numba would have to
+    # convert to typed dicts and would run slower, so speed-ups should come from
+    # caching and memoization in pure CPython.
+    
     def __init__(self, output_dir: str = "./output", custom_package: Optional[str] = None):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.console = Console()
         self.custom_package = custom_package
         
         # Java UML model
         self.classes: Dict[str, JavaClass] = {}
         self.relationships: List[Relationship] = []
-        self.packages: Set[str] = set()
-        
-        # Type mappings - support both xs: and xsd: prefixes
-        base_types = {
+        # (from, to, type, multiplicity, label) of each relationship, for O(1) duplicate checks
+        self._relationship_keys: Set[Tuple[str, str, str, str, str]] = set()
+        # Relationships found during class extraction, kept until all target classes exist
+        self._pending_relationships: List[Relationship] = []
+        # Insertion-ordered package names; the sorted view is cached until a new package appears
+        self.packages: Dict[str, None] = {}
+        self._sorted_packages: Optional[List[str]] = None
+        # Formatted output per (id(java_class), format); cleared whenever the model is rebuilt
+        self._format_cache: Dict[Tuple[int, str], Any] = {}
+        # Relationships whose endpoints both exist, shared by the PlantUML and Mermaid emitters
+        self._valid_relationships_key: Optional[Tuple[frozenset, int]] = None
+        self._valid_relationships_cache: List[Relationship] = []
+        # (model size key, summary) from the last _build_summary call
+        self._summary_cache: Optional[Tuple[Tuple[int, int, int], Dict[str, Any]]] = None
+        
+        # Type mappings keyed by local name; _xsd_type_to_java strips the xs:/xsd: prefix
+        self.xsd_to_java_types = {
             'string': 'String',
             'int': 'int',
             'integer': 'Integer',
@@ -87,16 +307,32 @@ class JavaUMLGenerator:
             'hexBinary': 'byte[]',
         }
         
-        # Create mappings for both xs: and xsd: prefixes
-        self.xsd_to_java_types = {}
-        for type_name, java_type in base_types.items():
-            self.xsd_to_java_types[f'xs:{type_name}'] = java_type
-            self.xsd_to_java_types[f'xsd:{type_name}'] = java_type
+        # Memoized results of _xsd_type_to_java, keyed by the raw XSD type string.
+        # Seeded with the prefixed built-ins so they resolve with a single lookup.
+        self._java_type_cache: Dict[str, str] = {
+            f'{prefix}:{type_name}': java_type
+            for type_name, java_type in self.xsd_to_java_types.items()
+            for prefix in ('xs', 'xsd')
+        }
         
-    def analyze_xsd_files(self, xsd_files: List[str]) -> Dict[str, Any]:
-        """Analyze XSD files and build Java UML model"""
+    @cached_property
+    def console(self) -> 'Console':
+        """Rich's process-wide console (shared with rich.print), created on first use"""
+        from rich import get_console
+        return get_console()
+        
+    def analyze_xsd_files(self, xsd_files: List[str], jobs: int = 1) -> Dict[str, Any]:
+        """
+        Analyze XSD files and build Java UML model
+        
+        Args:
+            xsd_files: XSD files to analyze
+            jobs: Worker processes for parsing unrelated files (1 parses serially, 0 uses all CPUs)
+        """
         
         self.console.print(f"\n🏗️ Generating Java UML from {len(xsd_files)} XSD files...")
+        self._format_cache.clear()
+        self._summary_cache = None
         
         # Parse all XSD files
         structures = {}
@@ -114,9 +350,12 @@ class JavaUMLGenerator:
             use_multi_file = self._should_use_multi_file_parser(xsd_files)
             
             if use_multi_file:
-                # Use multi-file parser for the main file (first one)
+                # Use multi-file parser for the main file (first one), sharing it
+                # with the other given files so common imports are parsed once
                 try:
                     parser = MultiFileXSDParser(str(xsd_files[0]))
+                    for xsd_file in xsd_files[1:]:
+                        parser.add_schema_file(str(xsd_file))
                     structure = parser.parse()
                     # Multi-file parser combines all files into one structure
                     structures[str(xsd_files[0])] = structure
@@ -125,35 +364,56 @@ class JavaUMLGenerator:
                     use_multi_file = False
             
             if not use_multi_file:
-                # Parse each file individually
-                for xsd_file in xsd_files:
-                    try:
-                        parser = XSDParser(str(xsd_file))
-                        structure = parser.parse()
-                        structures[str(xsd_file)] = structure
-                    except Exception as e:
-                        self.console.print(f"⚠️ Warning: Could not parse {xsd_file}: {e}")
+                # Parse each file individually - files are independent, so
+                # spread them across worker processes when requested
+                if jobs == 0:
+                    jobs = os.cpu_count() or 1
+                jobs = min(jobs, len(xsd_files))
+                file_paths = [str(xsd_file) for xsd_file in xsd_files]
+                
+                if jobs > 1:
+                    with ProcessPoolExecutor(max_workers=jobs) as executor:
+                        parsed = list(executor.map(_parse_xsd_file, file_paths))
+                else:
+                    parsed = [_parse_xsd_file(xsd_file) for xsd_file in file_paths]
+                    
+                for xsd_file, structure, error in parsed:
+                    if error is not None:
+                        self.console.print(f"⚠️ Warning: Could not parse {xsd_file}: {error}")
                         continue
+                    structures[xsd_file] = structure
             
-        # Extract Java classes from XSD structure
+        # Extract Java classes (and candidate relationships) from XSD structure
         for xsd_file, structure in structures.items():
             self._extract_classes_from_structure(structure, xsd_file)
             
         # Build relationships
-        for xsd_file, structure in structures.items():
-            self._extract_relationships_from_structure(structure, xsd_file)
+        self._resolve_relationships()
             
         return self._build_summary()
         
-    def _extract_classes_from_structure(self, structure: Dict[str, Any], xsd_file: str):
+    def _extract_classes_from_structure(self, structure: Dict[str, Any], xsd_file: str) -> None:
         """Extract Java classes from XSD structure"""
         
+        # Interned so every class from every file shares one copy of each namespace/package
         target_namespace = structure.get('target_namespace', '')
+        if isinstance(target_namespace, str):
+            target_namespace = sys.intern(target_namespace)
         package_name = self._namespace_to_package(target_namespace)
-        self.packages.add(package_name)
+        if package_name not in self.packages:
+            self.packages[package_name] = None
+            self._sorted_packages = None
+        
+        complex_types = structure.get('complex_types') or {}
+        elements = structure.get('elements') or []
+        simple_types = structure.get('simple_types') or {}
         
+        # Include/import-only schemas define nothing to turn into classes
+        if not (complex_types or elements or simple_types):
+            return
+            
         # Process complex types
-        for type_name, type_info in structure.get('complex_types', {}).items():
+        for type_name, type_info in complex_types.items():
             java_class = JavaClass(
                 name=self._to_java_class_name(type_name),
                 package=package_name,
@@ -171,108 +431,61 @@ class JavaUMLGenerator:
                 
             self.classes[java_class.name] = java_class
             
+            # Collect relationships in the same pass over the type
+            self._collect_relationships(java_class, type_info)
+            
         # Process global elements that could become classes
-        elements = structure.get('elements', [])
-        if isinstance(elements, list):
-            for element_info in elements:
-                element_name = element_info.get('name', '')
-                element_type = element_info.get('type') or ''
-                has_attributes = len(element_info.get('attributes', [])) > 0
+        for element_info in _normalize_elements(elements):
+            element_name = element_info.get('name', '')
+            element_type = element_info.get('type') or ''
+            has_attributes = len(element_info.get('attributes', [])) > 0
+            
+            # Create class for elements that:
+            # 1. Have a type ending in 'Type', OR
+            # 2. Have a complex_type, OR  
+            # 3. Have attributes directly (inline complex types)
+            if (element_type.endswith('Type') or 
+                element_info.get('complex_type') or 
+                has_attributes):
                 
-                # Create class for elements that:
-                # 1. Have a type ending in 'Type', OR
-                # 2. Have a complex_type, OR  
-                # 3. Have attributes directly (inline complex types)
-                if (element_type.endswith('Type') or 
-                    element_info.get('complex_type') or 
-                    has_attributes):
-                    
-                    java_class = JavaClass(
-                        name=self._to_java_class_name(element_name),
-                        package=package_name,
-                        namespace=target_namespace,
-                        documentation=self._extract_documentation(element_info),
-                        xsd_type='element'
-                    )
-                    
-                    # Extract attributes from element
-                    if 'complex_type' in element_info:
-                        self._extract_attributes_from_type(java_class, element_info['complex_type'])
-                    
-                    # Also extract direct attributes from the element itself
-                    if 'attributes' in element_info:
-                        for attr_info in element_info['attributes']:
-                            # Skip attributes without names (unresolved references)
-                            if not attr_info.get('name'):
-                                continue
-                                
-                            # Convert to the format expected by the Java generator
-                            java_type = self._xsd_type_to_java(attr_info.get('type', 'String'))
-                            
-                            # Check for duplicates by name to avoid processing the same attribute twice
-                            attr_name = self._to_java_field_name(attr_info.get('name', ''))
-                            if not any(existing_attr['name'] == attr_name for existing_attr in java_class.attributes):
-                                java_class.attributes.append({
-                                    'name': attr_name,
-                                    'type': java_type,
-                                    'visibility': 'private',
-                                    'documentation': attr_info.get('documentation', ''),
-                                    'is_attribute': True,
-                                    'required': attr_info.get('use') == 'required'
-                                })
-                    
-                    # Always add the class now (we know it has content if we reached here)
-                    self.classes[java_class.name] = java_class
-        else:
-            # Handle case where elements is a dict (older format)
-            for element_name, element_info in elements.items():
-                element_type = element_info.get('type') or ''
-                has_attributes = len(element_info.get('attributes', [])) > 0
+                java_class = JavaClass(
+                    name=self._to_java_class_name(element_name),
+                    package=package_name,
+                    namespace=target_namespace,
+                    documentation=self._extract_documentation(element_info),
+                    xsd_type='element'
+                )
                 
-                # Create class for elements that have type ending in 'Type', complex_type, or direct attributes
-                if (element_type.endswith('Type') or 
-                    element_info.get('complex_type') or 
-                    has_attributes):
-                    
-                    java_class = JavaClass(
-                        name=self._to_java_class_name(element_name),
-                        package=package_name,
-                        namespace=target_namespace,
-                        documentation=self._extract_documentation(element_info),
-                        xsd_type='element'
-                    )
-                    
-                    # Extract attributes from element
-                    if 'complex_type' in element_info:
-                        self._extract_attributes_from_type(java_class, element_info['complex_type'])
-                    
-                    # Also extract direct attributes from the element itself
-                    if 'attributes' in element_info:
-                        for attr_info in element_info['attributes']:
-                            # Skip attributes without names (unresolved references)
-                            if not attr_info.get('name'):
-                                continue
-                                
-                            # Convert to the format expected by the Java generator
-                            java_type = self._xsd_type_to_java(attr_info.get('type', 'String'))
+                # Extract attributes from element
+                if 'complex_type' in element_info:
+                    self._extract_attributes_from_type(java_class, element_info['complex_type'])
+                
+                # Also extract direct attributes from the element itself
+                if 'attributes' in element_info:
+                    # Names already on the class, for O(1) duplicate checks
+                    seen_names = {existing_attr['name'] for existing_attr in java_class.attributes}
+                    for attr_info in _normalize_elements(element_info['attributes']):
+                        get = attr_info.get
+                        # Skip attributes without names (unresolved references)
+                        raw_name = get('name')
+                        if not raw_name:
+                            continue
                             
-                            # Check for duplicates by name to avoid processing the same attribute twice
-                            attr_name = self._to_java_field_name(attr_info.get('name', ''))
-                            if not any(existing_attr['name'] == attr_name for existing_attr in java_class.attributes):
-                                java_class.attributes.append({
-                                    'name': attr_name,
-                                    'type': java_type,
-                                    'visibility': 'private',
-                                    'documentation': attr_info.get('documentation', ''),
-                                    'is_attribute': True,
-                                    'required': attr_info.get('use') == 'required'
-                                })
-                    
-                    # Always add the class now (we know it has content if we reached here)
-                    self.classes[java_class.name] = java_class
+                        # Convert to the format expected by the Java generator
+                        java_type = self._xsd_type_to_java(get('type', 'String'))
+                        
+                        # Check for duplicates by name to avoid processing the same attribute twice
+                        attr_name = self._to_java_field_name(raw_name)
+                        if attr_name not in seen_names:
+                            seen_names.add(attr_name)
+                            java_class.attributes.append(_attribute_field(
+                                attr_name, java_type, get('documentation', ''), get('use') == 'required'))
+                
+                # Always add the class now (we know it has content if we reached here)
+                self.classes[java_class.name] = java_class
                 
         # Process simple types as enums or constants
-        for type_name, type_info in structure.get('simple_types', {}).items():
+        for type_name, type_info in simple_types.items():
             # Handle direct enumeration
             if 'enumeration' in type_info:
                 java_class = JavaClass(
@@ -285,13 +498,8 @@ class JavaUMLGenerator:
                 
                 # Add enum values as constants
                 for enum_value in type_info.get('enumeration', []):
-                    java_class.attributes.append({
-                        'name': enum_value.upper().replace('-', '_'),
-                        'type': java_class.name,
-                        'visibility': 'public',
-                        'is_static': True,
-                        'is_final': True
-                    })
+                    java_class.attributes.append(_enum_constant(
+                        enum_value.upper().translate(_DASH_TO_UNDER), java_class.name))
                     
                 self.classes[java_class.name] = java_class
                 
@@ -342,142 +550,99 @@ class JavaUMLGenerator:
                         else:
                             value = str(enum_value)
                             
-                        java_class.attributes.append({
-                            'name': value.upper().replace('-', '_').replace(' ', '_'),
-                            'type': java_class.name,
-                            'visibility': 'public',
-                            'is_static': True,
-                            'is_final': True
-                        })
+                        java_class.attributes.append(_enum_constant(
+                            value.upper().translate(_ENUM_CONSTANT_TABLE), java_class.name))
                         
                     self.classes[java_class.name] = java_class
                 
-    def _extract_attributes_from_type(self, java_class: JavaClass, type_info: Dict[str, Any]):
+    def _extract_attributes_from_type(self, java_class: JavaClass, type_info: Dict[str, Any]) -> None:
         """Extract attributes from XSD type information"""
         
+        add_attribute = java_class.attributes.append
+        xsd_type_to_java = self._xsd_type_to_java
+        to_field_name = self._to_java_field_name
+        
         # Process elements within the type
-        elements = type_info.get('elements', [])
-        if isinstance(elements, list):
-            for element_info in elements:
-                element_name = element_info.get('name', '')
-                
-                # Check if element has restriction/enumeration
-                if ('restriction' in element_info or 'xsd:restriction' in element_info or 
-                    'simpleType' in element_info):
-                    java_type = self._handle_restriction_type(element_info)
-                else:
-                    java_type = self._xsd_type_to_java(element_info.get('type', 'String'))
+        for element_info in _normalize_elements(type_info.get('elements', [])):
+            get = element_info.get
+            
+            # Check if element has restriction/enumeration
+            if ('restriction' in element_info or 'xsd:restriction' in element_info or 
+                'simpleType' in element_info):
+                java_type = self._handle_restriction_type(element_info)
+            else:
+                java_type = xsd_type_to_java(get('type', 'String'))
+            
+            # Handle multiplicity
+            max_occurs: str = get('max_occurs', '1')
+            if _multiplicity(max_occurs)[0]:
+                java_type = f"List<{java_type}>"
                 
-                # Handle multiplicity
-                max_occurs = element_info.get('max_occurs', '1')
-                if max_occurs == 'unbounded' or (max_occurs.isdigit() and int(max_occurs) > 1):
-                    java_type = f"List<{java_type}>"
-                    
-                java_class.attributes.append({
-                    'name': self._to_java_field_name(element_name),
-                    'type': java_type,
-                    'visibility': 'private',
-                'documentation': element_info.get('documentation', ''),
-                'min_occurs': element_info.get('min_occurs', '1'),
-                'max_occurs': max_occurs
-            })
+            add_attribute(_element_field(
+                to_field_name(get('name', '')), java_type,
+                get('documentation', ''), get('min_occurs', '1'), max_occurs))
             
         # Process XSD attributes
-        attributes = type_info.get('attributes', [])
-        if isinstance(attributes, list):
-            for attr_info in attributes:
-                attr_name = attr_info.get('name', '')
-                
-                # Check if attribute has restriction/enumeration
-                if ('restriction' in attr_info or 'xsd:restriction' in attr_info or 
-                    'simpleType' in attr_info):
-                    java_type = self._handle_restriction_type(attr_info)
-                else:
-                    java_type = self._xsd_type_to_java(attr_info.get('type', 'String'))
-                
-                java_class.attributes.append({
-                    'name': self._to_java_field_name(attr_name),
-                    'type': java_type,
-                    'visibility': 'private',
-                    'documentation': attr_info.get('documentation', ''),
-                    'is_attribute': True,
-                    'required': attr_info.get('use') == 'required'
-                })
-        else:
-            # Handle dict format for backwards compatibility
-            for attr_name, attr_info in attributes.items():
-                # Check if attribute has restriction/enumeration
-                if ('restriction' in attr_info or 'xsd:restriction' in attr_info or 
-                    'simpleType' in attr_info):
-                    java_type = self._handle_restriction_type(attr_info)
-                else:
-                    java_type = self._xsd_type_to_java(attr_info.get('type', 'String'))
-                
-                java_class.attributes.append({
-                    'name': self._to_java_field_name(attr_name),
-                    'type': java_type,
-                    'visibility': 'private',
-                    'documentation': attr_info.get('documentation', ''),
-                    'is_attribute': True,
-                    'required': attr_info.get('use') == 'required'
-                })
+        for attr_info in _normalize_elements(type_info.get('attributes', [])):
+            get = attr_info.get
+            
+            # Check if attribute has restriction/enumeration
+            if ('restriction' in attr_info or 'xsd:restriction' in attr_info or 
+                'simpleType' in attr_info):
+                java_type = self._handle_restriction_type(attr_info)
+            else:
+                java_type = xsd_type_to_java(get('type', 'String'))
             
-    def _extract_relationships_from_structure(self, structure: Dict[str, Any], xsd_file: str):
-        """Extract relationships between classes from XSD structure"""
+            add_attribute(_attribute_field(
+                to_field_name(get('name', '')), java_type,
+                get('documentation', ''), get('use') == 'required'))
+            
+    def _collect_relationships(self, java_class: JavaClass, type_info: Dict[str, Any]) -> None:
+        """Queue relationships from a complex type; _resolve_relationships keeps those whose target exists"""
+        from_class = java_class.name
         
-        for type_name, type_info in structure.get('complex_types', {}).items():
-            from_class = self._to_java_class_name(type_name)
+        # Inheritance relationships
+        if java_class.extends:
+            self._pending_relationships.append(Relationship(
+                from_class=from_class,
+                to_class=java_class.extends,
+                relationship_type='inheritance',
+                label='extends'
+            ))
             
-            # Inheritance relationships
-            if 'base_type' in type_info and type_info['base_type']:
-                to_class = self._to_java_class_name(type_info['base_type'])
-                if to_class and to_class in self.classes:  # Only add if target class exists
-                    self.relationships.append(Relationship(
-                        from_class=from_class,
-                        to_class=to_class,
-                        relationship_type='inheritance',
-                        label='extends'
-                    ))
+        # Composition/Association relationships
+        for element_info in _normalize_elements(type_info.get('elements', [])):
+            element_name = element_info.get('name', '')
+            element_type = element_info.get('type', '')
+            if element_type and element_type.endswith('Type'):
+                max_occurs = element_info.get('max_occurs', '1')
+                relationship_type = 'composition' if element_info.get('min_occurs', '1') != '0' else 'association'
+                multiplicity = _multiplicity(max_occurs)[1]
                 
-            # Composition/Association relationships
-            elements = type_info.get('elements', [])
-            if isinstance(elements, list):
-                for element_info in elements:
-                    element_name = element_info.get('name', '')
-                    element_type = element_info.get('type', '')
-                    if element_type and element_type.endswith('Type'):
-                        to_class = self._to_java_class_name(element_type)
-                        if to_class in self.classes:
-                            max_occurs = element_info.get('max_occurs', '1')
-                            relationship_type = 'composition' if element_info.get('min_occurs', '1') != '0' else 'association'
-                            multiplicity = '1' if max_occurs == '1' else f"1..*" if max_occurs == 'unbounded' else f"1..{max_occurs}"
-                            
-                            self.relationships.append(Relationship(
-                                from_class=from_class,
-                                to_class=to_class,
-                                relationship_type=relationship_type,
-                                multiplicity=multiplicity,
-                                label=element_name
-                            ))
-            else:
-                # Handle dict format for backwards compatibility
-                for element_name, element_info in elements.items():
-                    element_type = element_info.get('type', '')
-                    if element_type and element_type.endswith('Type'):
-                        to_class = self._to_java_class_name(element_type)
-                        if to_class in self.classes:
-                            max_occurs = element_info.get('max_occurs', '1')
-                            relationship_type = 'composition' if element_info.get('min_occurs', '1') != '0' else 'association'
-                            multiplicity = '1' if max_occurs == '1' else f"1..*" if max_occurs == 'unbounded' else f"1..{max_occurs}"
-                            
-                            self.relationships.append(Relationship(
-                                from_class=from_class,
-                                to_class=to_class,
-                                relationship_type=relationship_type,
-                                multiplicity=multiplicity,
-                                label=element_name
-                            ))
-                        
+                self._pending_relationships.append(Relationship(
+                    from_class=from_class,
+                    to_class=self._to_java_class_name(element_type),
+                    relationship_type=relationship_type,
+                    multiplicity=multiplicity,
+                    label=element_name
+                ))
+                
+    def _resolve_relationships(self) -> None:
+        """Add queued relationships whose target class exists, once all classes are known"""
+        classes = self.classes
+        add_relationship = self._add_relationship
+        for rel in self._pending_relationships:
+            if rel.to_class in classes:  # Only add if target class exists
+                add_relationship(rel)
+        self._pending_relationships = []
+        
+    def _add_relationship(self, rel: Relationship) -> None:
+        """Record a relationship unless an identical one already exists"""
+        key = (rel.from_class, rel.to_class, rel.relationship_type, rel.multiplicity, rel.label)
+        if key not in self._relationship_keys:
+            self._relationship_keys.add(key)
+            self.relationships.append(rel)
+            
     def _namespace_to_package(self, namespace: str) -> str:
         """Convert XSD namespace to Java package name"""
         # Use custom package if provided
@@ -487,118 +652,99 @@ class JavaUMLGenerator:
         if not namespace:
             return 'com.example.schema'
             
-        # Extract domain from namespace
-        if '://' in namespace:
-            namespace = namespace.split('://', 1)[1]
-            
-        # Convert to package format
-        parts = namespace.replace('/', '.').split('.')
-        # Reverse domain parts
-        if len(parts) > 1:
-            parts = list(reversed(parts[:2])) + parts[2:]
-            
-        return '.'.join(part.lower().replace('-', '') for part in parts if part)
+        return _namespace_package(namespace)
         
     def _extract_documentation(self, element_info: Dict[str, Any]) -> str:
         """Extract documentation from XSD element info, handling various formats"""
-        doc_sources = [
+        doc_sources = (
             'documentation',  # Standard field
             'doc',           # Alternative field name
             'description',   # Another alternative
-        ]
-        
-        # Try standard documentation fields first
-        for field in doc_sources:
-            if field in element_info and element_info[field]:
-                return str(element_info[field]).strip()
+        )
+        
+        # Walk the element and its nested restrictions depth-first with an
+        # explicit stack instead of recursive calls
+        stack = [element_info]
+        while stack:
+            info = stack.pop()
+            if not isinstance(info, dict):
+                continue
                 
-        # Look for annotation/documentation structure
-        if 'annotation' in element_info:
-            annotation = element_info['annotation']
-            if isinstance(annotation, dict):
-                if 'documentation' in annotation:
-                    return str(annotation['documentation']).strip()
-                if 'doc' in annotation:
-                    return str(annotation['doc']).strip()
+            # One set intersection tells us which documentation sources are present;
+            # undocumented elements (the common case) are skipped immediately
+            present = info.keys() & _DOC_KEYS
+            if not present:
+                continue
+                
+            # Try standard documentation fields first
+            for field in doc_sources:
+                if field in present and info[field]:
+                    return str(info[field]).strip()
                     
-        # Look for nested structures that might contain documentation
-        if 'xsd:annotation' in element_info:
-            return self._extract_documentation({'annotation': element_info['xsd:annotation']})
-            
-        # Look in restriction for documentation
-        if 'restriction' in element_info:
-            restriction_doc = self._extract_documentation(element_info['restriction'])
-            if restriction_doc:
-                return restriction_doc
+            # Look for annotation/documentation structure
+            if 'annotation' in present:
+                doc = _annotation_documentation(info['annotation'])
+                if doc is not None:
+                    if doc:
+                        return doc
+                    continue
+                    
+            # An xsd:annotation is the last place to look on this element
+            if 'xsd:annotation' in present:
+                doc = _annotation_documentation(info['xsd:annotation'])
+                if doc:
+                    return doc
+                continue
+                
+            # Look in restrictions for documentation ('restriction' is searched first)
+            if 'xsd:restriction' in present:
+                stack.append(info['xsd:restriction'])
+            if 'restriction' in present:
+                stack.append(info['restriction'])
                 
-        if 'xsd:restriction' in element_info:
-            restriction_doc = self._extract_documentation(element_info['xsd:restriction'])
-            if restriction_doc:
-                return restriction_doc
-            
         return ""
         
     def _to_java_class_name(self, xsd_name: str) -> str:
         """Convert XSD type name to Java class name"""
-        if not xsd_name or xsd_name.strip() == "":
-            return f"UnnamedType{len(self.classes) + 1}"
-            
-        # Remove namespace prefix
-        if ':' in xsd_name:
-            xsd_name = xsd_name.split(':', 1)[1]
-            
-        # Handle empty name after prefix removal
-        if not xsd_name or xsd_name.strip() == "":
-            return f"UnnamedType{len(self.classes) + 1}"
-            
-        # Convert to PascalCase
-        parts = xsd_name.replace('-', '_').split('_')
-        result = ''.join(part.capitalize() for part in parts if part.strip())
-        
-        # Final fallback for empty result
+        # The PascalCase conversion is cached; only the fallback depends on state
+        result = _pascal_case(xsd_name) if xsd_name else ''
         return result if result else f"UnnamedType{len(self.classes) + 1}"
         
     def _to_java_field_name(self, xsd_name: str) -> str:
         """Convert XSD element name to Java field name"""
-        if not xsd_name:
-            return 'unnamed'
-            
-        # Remove namespace prefix
-        if ':' in xsd_name:
-            xsd_name = xsd_name.split(':', 1)[1]
-            
-        if not xsd_name:
-            return 'unnamed'
-            
-        # Convert to camelCase
-        parts = xsd_name.replace('-', '_').split('_')
-        return parts[0].lower() + ''.join(part.capitalize() for part in parts[1:])
+        return _camel_case(xsd_name) if xsd_name else 'unnamed'
         
     def _xsd_type_to_java(self, xsd_type: str) -> str:
         """Convert XSD type to Java type"""
         if not xsd_type:
             return 'String'
             
+        java_type = self._java_type_cache.get(xsd_type)
+        if java_type is None:
+            java_type = self._java_type_cache[xsd_type] = self._resolve_java_type(xsd_type)
+        return java_type
+        
+    def _resolve_java_type(self, xsd_type: str) -> str:
+        """Map a non-empty XSD type to its Java type (uncached)"""
         # Remove namespace prefix
         if ':' in xsd_type:
             prefix, local_type = xsd_type.split(':', 1)
             if not local_type:  # Handle case where local_type is empty
                 return 'String'
-            if prefix in ['xs', 'xsd']:  # Handle both standard XSD prefixes
-                xsd_type = f'{prefix}:{local_type}'
-            else:
+            if local_type.endswith(_CLASS_TYPE_SUFFIXES):
                 # Custom type - convert to class name for types ending with 'Type'
-                if local_type and (local_type.endswith('Type') or local_type.endswith('type')):
-                    return self._to_java_class_name(local_type)
-                else:
-                    # Unknown custom type, default to String
-                    return 'String'
+                return self._to_java_class_name(local_type)
+            if prefix in ('xs', 'xsd'):  # Handle both standard XSD prefixes
+                return self.xsd_to_java_types.get(local_type, 'String')
+            # Unknown custom type, default to String
+            return 'String'
         
         # Check for direct type ending in 'Type' (no namespace)
-        if xsd_type and (xsd_type.endswith('Type') or xsd_type.endswith('type')):
+        if xsd_type.endswith(_CLASS_TYPE_SUFFIXES):
             return self._to_java_class_name(xsd_type)
             
-        return self.xsd_to_java_types.get(xsd_type, 'String')
+        # Unprefixed built-in names are not mapped
+        return 'String'
         
     def _handle_restriction_type(self, element_info: Dict[str, Any]) -> str:
         """Handle restricted types that might be enums or constrained types"""
@@ -643,54 +789,67 @@ class JavaUMLGenerator:
     def generate_plantuml(self) -> str:
         """Generate PlantUML class diagram"""
         
-        # Debug: Show all classes found
-        self.console.print(f"Debug: Found {len(self.classes)} classes total:")
+        return ''.join(self.iter_plantuml())
+        
+    def iter_plantuml(self) -> Iterator[str]:
+        """Yield the PlantUML class diagram in chunks, for streaming to a file"""
+        
+        from rich.table import Table
+        
+        # Debug: Show all classes found, rendered as a single table
+        debug_table = Table(title=f"Debug: Found {len(self.classes)} classes total")
+        debug_table.add_column("Class", style="cyan")
+        debug_table.add_column("Attributes", justify="right")
+        debug_table.add_column("Type")
         for name, cls in self.classes.items():
-            self.console.print(f"  - {name}: {len(cls.attributes)} attributes, type: {cls.xsd_type}")
+            debug_table.add_row(name, str(len(cls.attributes)), cls.xsd_type)
+        self.console.print(debug_table)
         
         # Include all classes, not just those with attributes
         # Some classes might be important for relationships even without attributes
-        valid_classes = self.classes.copy()
+        valid_classes = self.classes
         
         # But for display purposes, we'll show a note if a class has no attributes
-        uml = ['@startuml XSD_Java_Classes', '']
+        yield '@startuml XSD_Java_Classes\n\n'
         
+        # Bucket classes by package in one pass, keeping class order
+        classes_by_package: Dict[str, List[JavaClass]] = defaultdict(list)
+        for java_class in valid_classes.values():
+            classes_by_package[java_class.package].append(java_class)
+            
         # Add packages
-        for package in sorted(self.packages):
-            # Check if this package has any classes
-            package_classes = [cls for cls in valid_classes.values() if cls.package == package]
+        for package in self._sorted_package_list():
+            # Skip packages without classes
+            package_classes = classes_by_package.get(package)
             if not package_classes:
                 continue
                 
-            uml.append(f'package "{package}" {{')
+            yield f'package "{package}" {{\n'
             
             # Add classes in this package
-            for class_name, java_class in valid_classes.items():
-                if java_class.package == package:
-                    uml.extend(self._class_to_plantuml(java_class))
-                    uml.append('')
-                    
-            uml.append('}')
-            uml.append('')
+            for java_class in package_classes:
+                yield self._class_to_plantuml(java_class)
+                
+            yield '}\n\n'
             
         # Add relationships - only for valid classes
-        relationships_added = False
-        for rel in self.relationships:
-            if (rel.from_class in valid_classes and 
-                rel.to_class in valid_classes):
-                if not relationships_added:
-                    uml.append('/' + '* Relationships *' + '/')
-                    relationships_added = True
-                uml.append(self._relationship_to_plantuml(rel))
+        valid_relationships = self._valid_relationships()
+        if valid_relationships:
+            yield '/' + '* Relationships *' + '/\n'
+            for rel in valid_relationships:
+                yield self._relationship_to_plantuml(rel)
+                yield '\n'
             
-        uml.append('')
-        uml.append('@enduml')
-        
-        return '\n'.join(uml)
+        yield '\n@enduml'
         
-    def _class_to_plantuml(self, java_class: JavaClass) -> List[str]:
-        """Convert Java class to PlantUML format"""
+    def _class_to_plantuml(self, java_class: JavaClass) -> str:
+        """Convert Java class to a PlantUML block, ending with a blank separator line"""
         
+        cache_key = (id(java_class), 'puml')
+        cached = self._format_cache.get(cache_key)
+        if cached is not None:
+            return cached
+            
         lines = []
         
         # Class declaration
@@ -705,15 +864,16 @@ class JavaUMLGenerator:
             
         lines.append(class_line + ' {')
         
-        # Add attributes
+        # Add attributes and their getters/setters in one pass
+        methods = []
         if java_class.attributes:
-            for attr in java_class.attributes:
-                visibility = '+' if attr['visibility'] == 'public' else '-'
-                static_final = ''
-                if attr.get('is_static') and attr.get('is_final'):
-                    static_final = ' {static}'
+            for name, typ, vis, static_final, getter, setter in zip(*java_class.attribute_columns()):
+                if static_final:
+                    lines.append(f'  {vis}{name} : {typ} {{static}}')
+                    continue
                     
-                lines.append(f'  {visibility}{attr["name"]} : {attr["type"]}{static_final}')
+                lines.append(f'  {vis}{name} : {typ}')
+                methods.append(f'  +{getter}() : {typ}\n  +{setter}({name}: {typ}) : void')
         else:
             # Add a placeholder comment for empty classes
             lines.append('  // No attributes found in XSD')
@@ -721,36 +881,49 @@ class JavaUMLGenerator:
         # Add methods (getters/setters)
         if java_class.attributes and java_class.xsd_type != 'enum':
             lines.append('  --')
-            for attr in java_class.attributes:
-                if not (attr.get('is_static') and attr.get('is_final')):
-                    # Getter
-                    getter_name = f'get{attr["name"].capitalize()}'
-                    lines.append(f'  +{getter_name}() : {attr["type"]}')
-                    # Setter
-                    setter_name = f'set{attr["name"].capitalize()}'
-                    lines.append(f'  +{setter_name}({attr["name"]}: {attr["type"]}) : void')
+            lines.extend(methods)
                     
         lines.append('}')
         
         # Add note if there's documentation
-        if java_class.documentation:
+        doc = java_class.documentation
+        if doc:
+            note_body = doc if len(doc) <= 100 else f'{doc[:100]}...'
             lines.append(f'note right of {java_class.name}')
-            lines.append(f'  {java_class.documentation[:100]}{"..." if len(java_class.documentation) > 100 else ""}')
+            lines.append(f'  {note_body}')
             lines.append('end note')
             
-        return lines
+        block = '\n'.join(lines) + '\n\n'
+        self._format_cache[cache_key] = block
+        return block
+        
+    def _sorted_package_list(self) -> List[str]:
+        """Return package names in sorted order, sorting only after new packages were added"""
+        
+        if self._sorted_packages is None:
+            self._sorted_packages = sorted(self.packages)
+        return self._sorted_packages
+        
+    def _valid_relationships(self) -> List[Relationship]:
+        """Return relationships whose endpoints are both known classes, recomputed when the model changes"""
+        
+        key = (frozenset(self.classes), len(self.relationships))
+        if key != self._valid_relationships_key:
+            classes = self.classes
+            self._valid_relationships_cache = [
+                rel for rel in self.relationships
+                if rel.from_class in classes and rel.to_class in classes
+            ]
+            self._valid_relationships_key = key
+        return self._valid_relationships_cache
         
     def _relationship_to_plantuml(self, rel: Relationship) -> str:
         """Convert relationship to PlantUML format"""
         
-        arrow_map = {
-            'inheritance': '--|>',
-            'composition': '*--',
-            'aggregation': 'o--',
-            'association': '-->'
-        }
-        
-        arrow = arrow_map.get(rel.relationship_type, '-->')
+        arrow = _PLANTUML_ARROWS.get(rel.relationship_type, '-->')
+        if not rel.label and rel.multiplicity == '1':
+            return f'{rel.from_class} {arrow} {rel.to_class}'
+            
         label = f' : {rel.label}' if rel.label else ''
         multiplicity = f' "{rel.multiplicity}"' if rel.multiplicity != '1' else ''
         
@@ -759,67 +932,74 @@ class JavaUMLGenerator:
     def generate_mermaid(self) -> str:
         """Generate Mermaid class diagram"""
         
-        mermaid = ['classDiagram']
+        return ''.join(self.iter_mermaid())
+        
+    def iter_mermaid(self) -> Iterator[str]:
+        """Yield the Mermaid class diagram in chunks, for streaming to a file"""
+        
+        yield 'classDiagram'
         
         # Include all classes, not just those with attributes
-        valid_classes = self.classes.copy()
+        valid_classes = self.classes
         
         # Add classes
         for class_name, java_class in valid_classes.items():
-            mermaid.extend(self._class_to_mermaid(java_class))
+            yield '\n'
+            yield self._class_to_mermaid(java_class)
             
-        # Add relationships - filter out empty relationship strings
-        for rel in self.relationships:
-            relationship_str = self._relationship_to_mermaid(rel)
-            if relationship_str.strip():  # Only add non-empty relationships
-                mermaid.append(relationship_str)
+        # Add relationships - only those between classes that have content
+        renderable = frozenset(name for name, java_class in self.classes.items() if java_class.attributes)
+        for rel in self._valid_relationships():
+            if rel.from_class in renderable and rel.to_class in renderable:
+                yield '\n'
+                yield self._relationship_to_mermaid(rel, renderable)
+        
+    def _class_to_mermaid(self, java_class: JavaClass) -> str:
+        """Convert Java class to a Mermaid block"""
+        
+        cache_key = (id(java_class), 'mmd')
+        cached = self._format_cache.get(cache_key)
+        if cached is not None:
+            return cached
             
-        return '\n'.join(mermaid)
-        
-    def _class_to_mermaid(self, java_class: JavaClass) -> List[str]:
-        """Convert Java class to Mermaid format"""
-        
         lines = []
         
         # Class declaration
         lines.append(f'  class {java_class.name} {{')
         
-        # Add attributes
-        for attr in java_class.attributes:
-            visibility = '+' if attr['visibility'] == 'public' else '-'
-            lines.append(f'    {visibility}{attr["type"]} {attr["name"]}')
+        # Add attributes and their getters/setters in one pass
+        methods = []
+        for name, typ, vis, static_final, getter, setter in zip(*java_class.attribute_columns()):
+            lines.append(f'    {vis}{typ} {name}')
+            if not static_final:
+                methods.append(f'    +{getter}() {typ}\n    +{setter}({typ}) void')
             
         # Add methods
-        if java_class.attributes and java_class.xsd_type != 'enum':
-            for attr in java_class.attributes:
-                if not (attr.get('is_static') and attr.get('is_final')):
-                    getter_name = f'get{attr["name"].capitalize()}'
-                    setter_name = f'set{attr["name"].capitalize()}'
-                    lines.append(f'    +{getter_name}() {attr["type"]}')
-                    lines.append(f'    +{setter_name}({attr["type"]}) void')
+        if java_class.xsd_type != 'enum':
+            lines.extend(methods)
                     
         lines.append('  }')
         
-        return lines
+        block = '\n'.join(lines)
+        self._format_cache[cache_key] = block
+        return block
         
-    def _relationship_to_mermaid(self, rel: Relationship) -> str:
-        """Convert relationship to Mermaid format"""
+    def _relationship_to_mermaid(self, rel: Relationship, renderable: Optional[frozenset] = None) -> str:
+        """Convert relationship to Mermaid format
         
+        Args:
+            rel: Relationship to convert
+            renderable: Names of classes that exist and have attributes; computed if not given
+        """
+        
+        if renderable is None:
+            renderable = frozenset(name for name, java_class in self.classes.items() if java_class.attributes)
+            
         # Only include relationships where both classes exist and have content
-        if (rel.from_class not in self.classes or 
-            rel.to_class not in self.classes or
-            not self.classes[rel.from_class].attributes or
-            not self.classes[rel.to_class].attributes):
+        if rel.from_class not in renderable or rel.to_class not in renderable:
             return ""
         
-        arrow_map = {
-            'inheritance': '<|--',
-            'composition': '*--',
-            'aggregation': 'o--',
-            'association': '-->'
-        }
-        
-        arrow = arrow_map.get(rel.relationship_type, '-->')
+        arrow = _MERMAID_ARROWS.get(rel.relationship_type, '-->')
         label = f' : {rel.label}' if rel.label else ''
         
         return f'  {rel.to_class} {arrow} {rel.from_class}{label}'
@@ -827,19 +1007,23 @@ class JavaUMLGenerator:
     def generate_java_code(self) -> Dict[str, str]:
         """Generate Java source code for all classes"""
         
-        java_files = {}
+        # Package directory per package, computed once however many classes share it
+        packages = {java_class.package for java_class in self.classes.values()}
+        package_dirs = {package: package.replace('.', '/') for package in packages}
         
-        for class_name, java_class in self.classes.items():
-            java_code = self._class_to_java_code(java_class)
-            package_dir = java_class.package.replace('.', '/')
-            file_path = f'{package_dir}/{class_name}.java'
-            java_files[file_path] = java_code
-            
-        return java_files
+        return {
+            f'{package_dirs[java_class.package]}/{class_name}.java': self._class_to_java_code(java_class)
+            for class_name, java_class in self.classes.items()
+        }
         
     def _class_to_java_code(self, java_class: JavaClass) -> str:
         """Convert Java class to actual Java code"""
         
+        cache_key = (id(java_class), 'java')
+        cached = self._format_cache.get(cache_key)
+        if cached is not None:
+            return cached
+            
         lines = []
         
         # Package declaration
@@ -847,20 +1031,9 @@ class JavaUMLGenerator:
         lines.append('')
         
         # Imports
-        imports = set()
-        for attr in java_class.attributes:
-            if attr['type'].startswith('List<'):
-                imports.add('import java.util.List;')
-                imports.add('import java.util.ArrayList;')
-            elif attr['type'] in ['LocalDate', 'LocalDateTime', 'LocalTime']:
-                imports.add(f'import java.time.{attr["type"]};')
-            elif attr['type'] == 'BigDecimal':
-                imports.add('import java.math.BigDecimal;')
-            elif attr['type'] == 'URI':
-                imports.add('import java.net.URI;')
-                
-        for imp in sorted(imports):
-            lines.append(imp)
+        names, types, _, static_final_mask, getters, setters = java_class.attribute_columns()
+        imports = _java_imports(types)
+        lines.extend(imports)
             
         if imports:
             lines.append('')
@@ -868,7 +1041,8 @@ class JavaUMLGenerator:
         # Class documentation
         if java_class.documentation:
             lines.append('/**')
-            lines.append(f' * {java_class.documentation}')
+            # One Javadoc line per documentation line
+            lines.extend(f' * {doc_line.strip()}' for doc_line in java_class.documentation.splitlines())
             lines.append(' * Generated from XSD schema')
             lines.append(' */')
             
@@ -889,15 +1063,26 @@ class JavaUMLGenerator:
         
         # Enum values (for enum classes)
         if java_class.xsd_type == 'enum':
-            enum_values = [attr['name'] for attr in java_class.attributes if attr.get('is_static') and attr.get('is_final')]
+            enum_values = [n for n, static_final in zip(names, static_final_mask) if static_final]
             if enum_values:
                 lines.append(f'    {", ".join(enum_values)};')
                 lines.append('')
         else:
-            # Fields
-            for attr in java_class.attributes:
-                if not (attr.get('is_static') and attr.get('is_final')):
-                    lines.append(f'    private {attr["type"]} {attr["name"]};')
+            # Fields, with one getter/setter block per field
+            accessors = []
+            for n, t, static_final, getter, setter in zip(names, types, static_final_mask, getters, setters):
+                if static_final:
+                    continue
+                lines.append(f'    private {t} {n};')
+                accessors.append(
+                    f'    public {t} {getter}() {{\n'
+                    f'        return {n};\n'
+                    f'    }}\n'
+                    f'\n'
+                    f'    public void {setter}({t} {n}) {{\n'
+                    f'        this.{n} = {n};\n'
+                    f'    }}\n'
+                )
                     
             lines.append('')
             
@@ -907,30 +1092,22 @@ class JavaUMLGenerator:
             lines.append('')
             
             # Getters and Setters
-            for attr in java_class.attributes:
-                if not (attr.get('is_static') and attr.get('is_final')):
-                    # Getter
-                    getter_name = f'get{attr["name"].capitalize()}'
-                    lines.append(f'    public {attr["type"]} {getter_name}() {{')
-                    lines.append(f'        return {attr["name"]};')
-                    lines.append('    }')
-                    lines.append('')
-                    
-                    # Setter
-                    setter_name = f'set{attr["name"].capitalize()}'
-                    lines.append(f'    public void {setter_name}({attr["type"]} {attr["name"]}) {{')
-                    lines.append(f'        this.{attr["name"]} = {attr["name"]};')
-                    lines.append('    }')
-                    lines.append('')
+            lines.extend(accessors)
                     
         lines.append('}')
         
-        return '\n'.join(lines)
+        java_code = '\n'.join(lines)
+        self._format_cache[cache_key] = java_code
+        return java_code
         
     def _build_summary(self) -> Dict[str, Any]:
-        """Build summary of generated Java UML model"""
+        """Build summary of generated Java UML model, reusing the last one if the model is unchanged"""
         
-        return {
+        key = (len(self.classes), len(self.relationships), len(self.packages))
+        if self._summary_cache is not None and self._summary_cache[0] == key:
+            return self._summary_cache[1]
+            
+        summary = {
             'classes': len(self.classes),
             'packages': len(self.packages),
             'relationships': len(self.relationships),
@@ -939,12 +1116,12 @@ class JavaUMLGenerator:
                 'attributes': len(cls.attributes),
                 'type': cls.xsd_type
             } for name, cls in self.classes.items()},
-            'package_list': sorted(self.packages),
-            'relationship_types': {
-                rel_type: len([r for r in self.relationships if r.relationship_type == rel_type])
-                for rel_type in set(r.relationship_type for r in self.relationships)
-            }
+            'package_list': list(self._sorted_package_list()),
+            'package_class_counts': dict(Counter(cls.package for cls in self.classes.values())),
+            'relationship_types': dict(Counter(r.relationship_type for r in self.relationships))
         }
+        self._summary_cache = (key, summary)
+        return summary
     
     def _should_use_multi_file_parser(self, xsd_files: List[str]) -> bool:
         """Determine if multi-file parser should be used based on file content."""
@@ -971,17 +1148,15 @@ class JavaUMLGenerator:
         results = {}
         
         if 'plantuml' in formats:
-            plantuml_content = self.generate_plantuml()
             plantuml_file = self.output_dir / 'java_classes.puml'
             with open(plantuml_file, 'w', encoding='utf-8') as f:
-                f.write(plantuml_content)
+                f.writelines(self.iter_plantuml())
             results['plantuml'] = str(plantuml_file)
             
         if 'mermaid' in formats:
-            mermaid_content = self.generate_mermaid()
             mermaid_file = self.output_dir / 'java_classes.mmd'
             with open(mermaid_file, 'w', encoding='utf-8') as f:
-                f.write(mermaid_content)
+                f.writelines(self.iter_mermaid())
             results['mermaid'] = str(mermaid_file)
             
         if 'java' in formats:
@@ -989,25 +1164,34 @@ class JavaUMLGenerator:
             java_dir = self.output_dir / 'java'
             java_dir.mkdir(exist_ok=True)
             
-            for file_path, java_code in java_files.items():
-                full_path = java_dir / file_path
-                full_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(full_path, 'w', encoding='utf-8') as f:
-                    f.write(java_code)
+            items = [(java_dir / file_path, java_code) for file_path, java_code in java_files.items()]
+            # Create package directories up front so the writer threads never race on mkdir
+            for parent in {full_path.parent for full_path, _ in items}:
+                parent.mkdir(parents=True, exist_ok=True)
+                
+            # File writes are I/O bound, so overlap them on a thread pool;
+            # a handful of files is cheaper to write than to start the pool for
+            if len(items) < _MIN_PARALLEL_WRITES:
+                for item in items:
+                    _write_java_file(item)
+            else:
+                max_workers = min(32, (os.cpu_count() or 1) * 4, len(items))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    list(executor.map(_write_java_file, items))
                     
             results['java'] = str(java_dir)
             
-        # Save summary
+        # Save summary (reuses the one built by analyze_xsd_files unless the model changed)
         summary = self._build_summary()
         summary_file = self.output_dir / 'java_uml_summary.json'
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2)
+        dump_json(summary, summary_file, default=str)
         results['summary'] = str(summary_file)
         
         return results
         
     def print_summary(self, summary: Dict[str, Any]):
         """Print analysis summary"""
+        from rich.table import Table
         
         self.console.print("\n📊 Java UML Generation Summary")
         
@@ -1025,14 +1209,18 @@ class JavaUMLGenerator:
         # Package breakdown
         if summary['package_list']:
             self.console.print("\n📦 Packages Created:")
+            package_counts = summary.get('package_class_counts')
+            if package_counts is None:
+                # Summaries saved before package_class_counts existed
+                package_counts = Counter(c['package'] for c in summary['class_details'].values())
             for package in summary['package_list']:
-                class_count = len([c for c in summary['class_details'].values() if c['package'] == package])
-                self.console.print(f"  • {package} ({class_count} classes)")
+                self.console.print(f"  • {package} ({package_counts.get(package, 0)} classes)")
                 
         # Relationship breakdown
         if summary['relationship_types']:
             self.console.print("\n🔗 Relationships:")
-            for rel_type, count in summary['relationship_types'].items():
+            # Most frequent first; the summary stores a plain dict so it stays JSON-friendly
+            for rel_type, count in Counter(summary['relationship_types']).most_common():
                 self.console.print(f"  • {rel_type.title()}: {count}")
 
 def main():
@@ -1072,12 +1260,17 @@ Examples:
                        help='Only show summary, don\'t generate files')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Enable verbose logging')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                       help='Worker processes for parsing independent XSD files (default: 1, 0 = all CPUs)')
     
     args = parser.parse_args()
+    args.xsd_files = expand_xsd_paths(args.xsd_files)
+    
+    from rich import print as rprint
     
     # Setup logging
     if args.verbose:
-        logging.basicConfig(level=logging.INFO)
+        configure_logging(logging.INFO)
         
     # Handle 'all' format selection
     if 'all' in args.formats:
@@ -1088,7 +1281,7 @@ Examples:
         generator = JavaUMLGenerator(args.output_dir, args.java_package)
         
         # Analyze XSD files
-        summary = generator.analyze_xsd_files(args.xsd_files)
+        summary = generator.analyze_xsd_files(args.xsd_files, jobs=args.jobs)
         
         # Print summary
         generator.print_summary(summary)
@@ -5,32 +5,33 @@ Allows analyzing specific components from different schema files.
 """
 
 import argparse
-import json
 import logging
+import re
 import sys
 from pathlib import Path
 from typing import List, Optional
 
 from src.parsers.selective_xsd_parser import SelectiveXSDParser, SelectionCriteria
-from src.generators.html_generator import HTMLGenerator
-from rich.console import Console
-from rich.table import Table
-from rich.tree import Tree
-from rich import print as rprint
+from src.cli_utils import configure_logging, dump_json, expand_xsd_paths
+from rich import get_console
 
-console = Console()
+# Rich's process-wide console, shared with rich.print and the other analyzers
+console = get_console()
 logger = logging.getLogger(__name__)
 
+# Commas with any surrounding whitespace separate component names on the CLI
+_COMPONENT_SEPARATOR = re.compile(r'\s*,\s*')
+
 class SelectiveAnalyzer:
     """
     Main analyzer for selective XSD component analysis.
     """
     
-    def __init__(self, output_dir: str = "./output"):
-        """Initialize the selective analyzer."""
+    def __init__(self, output_dir: str = "./output", use_cache: bool = False):
+        """Initialize the selective analyzer; use_cache keeps parse results under output_dir/.cache."""
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.parser = SelectiveXSDParser()
+        self.parser = SelectiveXSDParser(cache_dir=self.output_dir / ".cache" if use_cache else None)
         self.structure = None
     
     def add_file_selection(self, 
@@ -59,12 +60,17 @@ class SelectiveAnalyzer:
         
         console.print(f"[green]✓[/green] Added selections from [bold]{file_path}[/bold]: {', '.join(selections)}")
     
-    def analyze(self) -> dict:
-        """Perform the selective analysis."""
+    def analyze(self, jobs: int = 1) -> dict:
+        """
+        Perform the selective analysis.
+        
+        Args:
+            jobs: Worker processes for parsing distinct files (1 parses serially, 0 uses all CPUs)
+        """
         console.print("[bold blue]Starting selective XSD analysis...[/bold blue]")
         
         with console.status("[bold green]Parsing selected components..."):
-            self.structure = self.parser.parse_selections()
+            self.structure = self.parser.parse_selections(jobs=jobs)
         
         console.print("[bold green]✓[/bold green] Selective analysis complete")
         return self.structure
@@ -75,6 +81,8 @@ class SelectiveAnalyzer:
             console.print("[red]No analysis results available. Run analyze() first.[/red]")
             return
         
+        from rich.table import Table
+        
         console.print("\n[bold]Selective Analysis Summary[/bold]")
         
         # Main summary table
@@ -93,6 +101,10 @@ class SelectiveAnalyzer:
         
         # File breakdown
         selection_summary = self.structure.get('selection_summary', {})
+        parser_summary = self.parser.get_selection_summary()
+        # Both breakdowns are keyed by the same source paths
+        file_names = {file_path: Path(file_path).name
+                      for file_path in selection_summary.keys() | parser_summary.keys()}
         if selection_summary:
             console.print("\n[bold]Selection by File[/bold]")
             
@@ -102,40 +114,50 @@ class SelectiveAnalyzer:
             file_table.add_column("Complex Types", justify="right", style="blue")
             file_table.add_column("Simple Types", justify="right", style="yellow")
             
-            for file_path, counts in selection_summary.items():
-                file_table.add_row(
-                    Path(file_path).name,
-                    str(counts.get('elements', 0)),
-                    str(counts.get('complex_types', 0)),
-                    str(counts.get('simple_types', 0))
-                )
+            rows = [
+                (file_names[file_path],
+                 str(counts.get('elements', 0)),
+                 str(counts.get('complex_types', 0)),
+                 str(counts.get('simple_types', 0)))
+                for file_path, counts in selection_summary.items()
+            ]
+            for row in rows:
+                file_table.add_row(*row)
             
             console.print(file_table)
         
         # Selection details
-        parser_summary = self.parser.get_selection_summary()
         if parser_summary:
-            console.print("\n[bold]Selection Details[/bold]")
+            # Collect the details and print them once rather than line by line
+            lines = ["\n[bold]Selection Details[/bold]"]
             
             for file_path, details in parser_summary.items():
-                console.print(f"\n[cyan]{Path(file_path).name}[/cyan]:")
+                lines.append(f"\n[cyan]{file_names[file_path]}[/cyan]:")
                 
                 if details['elements']:
-                    console.print(f"  [green]Elements:[/green] {', '.join(details['elements'])}")
+                    lines.append(f"  [green]Elements:[/green] {', '.join(details['elements'])}")
                 if details['complex_types']:
-                    console.print(f"  [blue]Complex Types:[/blue] {', '.join(details['complex_types'])}")
+                    lines.append(f"  [blue]Complex Types:[/blue] {', '.join(details['complex_types'])}")
                 if details['simple_types']:
-                    console.print(f"  [yellow]Simple Types:[/yellow] {', '.join(details['simple_types'])}")
+                    lines.append(f"  [yellow]Simple Types:[/yellow] {', '.join(details['simple_types'])}")
                 if details['namespaces']:
-                    console.print(f"  [magenta]Namespaces:[/magenta] {', '.join(details['namespaces'])}")
+                    lines.append(f"  [magenta]Namespaces:[/magenta] {', '.join(details['namespaces'])}")
+            
+            console.print("\n".join(lines))
     
     def generate_html_documentation(self) -> None:
         """Generate HTML documentation for selected components."""
         if not self.structure:
             raise ValueError("Must run analyze() first")
         
+        # Jinja2 and the HTML generator are only loaded when HTML output is requested
+        from src.generators.html_generator import HTMLGenerator
+        
         console.print("[bold blue]Generating HTML documentation for selections...[/bold blue]")
         
+        # The parsed trees are not needed once the combined structure exists
+        self.parser.clear_intermediate_buffers()
+        
         html_output_dir = self.output_dir / "html"
         generator = HTMLGenerator(self.structure)  # Don't pass template_dir to constructor
         generator.generate_documentation(str(html_output_dir))
@@ -149,8 +171,7 @@ class SelectiveAnalyzer:
         
         json_path = self.output_dir / "selective_analysis.json"
         
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(self.structure, f, indent=2, default=str)
+        dump_json(self.structure, json_path, default=str)
         
         console.print(f"[bold green]✓[/bold green] JSON export created: {json_path}")
 
@@ -158,7 +179,7 @@ def parse_component_list(value: str) -> List[str]:
     """Parse a comma-separated list of component names."""
     if not value:
         return []
-    return [name.strip() for name in value.split(',') if name.strip()]
+    return [name for name in _COMPONENT_SEPARATOR.split(value.strip()) if name]
 
 def main():
     """Main entry point for selective XSD analysis."""
@@ -227,13 +248,23 @@ Examples:
         action='store_true',
         help='Enable verbose logging'
     )
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Reuse parse results cached in <output-dir>/.cache while the XSD files are unchanged '
+             '(cache files are unpickled; only use an output directory you trust)'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Worker processes for parsing multiple XSD files (default: 1, 0 = all CPUs)'
+    )
     
     args = parser.parse_args()
+    args.xsd_files = expand_xsd_paths(args.xsd_files)
     
-    if args.verbose:
-        logging.basicConfig(level=logging.DEBUG)
-    else:
-        logging.basicConfig(level=logging.INFO)
+    configure_logging(logging.DEBUG if args.verbose else logging.INFO)
     
     # Parse the complex command line arguments
     # This is a simplified version - in practice, you'd want more sophisticated parsing
@@ -241,7 +272,7 @@ Examples:
     console.print("[yellow]Example: See the demo script for detailed usage examples.[/yellow]")
     
     try:
-        analyzer = SelectiveAnalyzer(args.output_dir)
+        analyzer = SelectiveAnalyzer(args.output_dir, use_cache=args.cache)
         
         # Parse selection criteria from command line
         elements = parse_component_list(args.elements) if args.elements else None
@@ -267,7 +298,7 @@ Examples:
             )
         
         # Perform analysis
-        analyzer.analyze()
+        analyzer.analyze(jobs=args.jobs)
         
         # Generate requested outputs
         if 'summary' in args.formats:
@@ -5,7 +5,7 @@ Generates multiple output formats including HTML documentation, tree visualizati
 """
 
 import argparse
-import json
+import io
 import logging
 from pathlib import Path
 from typing import Dict, Any, Optional, List
@@ -18,6 +18,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'utils'))
 from src.parsers.xsd_parser import XSDParser
 from src.parsers.multi_file_xsd_parser import MultiFileXSDParser
 from src.generators.html_generator import HTMLGenerator
+from src.cli_utils import dump_json
 from rich.console import Console
 from rich.progress import track
 from rich.table import Table
@@ -110,8 +111,7 @@ class XSDAnalyzer:
         
         json_path = self.output_dir / "structure.json"
         
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(self.structure, f, indent=2, ensure_ascii=False)
+        dump_json(self.structure, json_path)
         
         console.print(f"[bold green]✓[/bold green] JSON export created: {json_path}")
     
@@ -124,8 +124,10 @@ class XSDAnalyzer:
         
         summary_path = self.output_dir / "summary.txt"
         
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            self._write_text_summary(f)
+        # Render in memory, then write the file in one call
+        buffer = io.StringIO()
+        self._write_text_summary(buffer)
+        summary_path.write_text(buffer.getvalue(), encoding='utf-8')
         
         console.print(f"[bold green]✓[/bold green] Text summary created: {summary_path}")
     
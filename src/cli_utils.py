@@ -0,0 +1,63 @@
+"""
+Helpers shared by the command-line analyzers.
+"""
+
+import glob
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+try:
+    import orjson  # optional, faster JSON export
+except ImportError:
+    orjson = None
+
+
+def dump_json(obj: Any, path: Path, default: Optional[Callable[[Any], Any]] = None) -> None:
+    """
+    Write obj to path as indented UTF-8 JSON, using orjson when it is installed.
+
+    Args:
+        obj: Data to serialise
+        path: Output file
+        default: Fallback converter for objects JSON cannot encode
+    """
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, default=default,
+                                      option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        path.write_text(json.dumps(obj, indent=2, ensure_ascii=False, default=default), encoding='utf-8')
+
+
+def expand_xsd_paths(paths: List[str]) -> List[str]:
+    """
+    Expand glob patterns and directories among the XSD paths given on a command line.
+
+    Patterns are expanded here rather than by the shell (Windows shells do not),
+    directories contribute their .xsd files, and duplicates are dropped in order.
+    Anything else, including patterns with no match, is passed through so a
+    missing file is still reported by the analyzer.
+    """
+    expanded: List[str] = []
+    for path in paths:
+        if any(char in path for char in '*?['):
+            expanded.extend(sorted(glob.glob(path, recursive=True)) or [path])
+        elif os.path.isdir(path):
+            with os.scandir(path) as entries:
+                expanded.extend(sorted(entry.path for entry in entries
+                                       if entry.is_file() and entry.name.lower().endswith('.xsd')))
+        else:
+            expanded.append(path)
+    return list(dict.fromkeys(expanded))
+
+
+def configure_logging(level: int) -> None:
+    """Set the root log level, installing a handler only if logging is not configured yet."""
+    root_logger = logging.getLogger()
+    if root_logger.hasHandlers():
+        # xsd_parser configures logging on import, which makes basicConfig a no-op
+        root_logger.setLevel(level)
+    else:
+        logging.basicConfig(level=level)
@@ -5,13 +5,24 @@ Creates comprehensive, navigable documentation with cross-references.
 
 import os
 import json
+from collections import defaultdict
+from functools import cached_property, lru_cache
 from typing import Dict, List, Any, Optional
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import BytecodeCache, Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
 import logging
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def _bytecode_cache() -> Optional[BytecodeCache]:
+    """Compiled-template cache in the user's temp directory, shared by every generator and run."""
+    try:
+        return FileSystemBytecodeCache()
+    except (OSError, RuntimeError) as e:
+        logger.debug(f"Jinja bytecode cache unavailable: {e}")
+        return None
+
 class HTMLGenerator:
     """
     Generates comprehensive HTML documentation from parsed XSD structure.
@@ -27,11 +38,15 @@ class HTMLGenerator:
         """
         self.structure = xsd_structure
         self.template_dir = template_dir or self._get_default_template_dir()
+        self._type_links: Dict[str, str] = {}  # type name -> link, filled by the get_type_link filter
         
-        # Initialize Jinja2 environment
+        # Initialize Jinja2 environment; templates are compiled once and reused
+        # from the bytecode cache, and are not re-checked during a generation run
         self.env = Environment(
             loader=FileSystemLoader(self.template_dir),
-            autoescape=select_autoescape(['html', 'xml'])
+            autoescape=select_autoescape(['html', 'xml']),
+            bytecode_cache=_bytecode_cache(),
+            auto_reload=False
         )
         
         # Add custom filters
@@ -222,37 +237,42 @@ class HTMLGenerator:
         
         return list(set(dependencies))
     
-    def _find_element_dependents(self, element_name: str) -> List[str]:
-        """Find what depends on this element."""
-        dependents = []
+    @cached_property
+    def _dependents_by_type(self) -> Dict[Optional[str], List[str]]:
+        """Map each referenced type to the names of the items that use it, built in one walk."""
+        dependents: Dict[Optional[str], List[str]] = defaultdict(list)
         
         # Search through all elements and types
-        def check_dependencies(item: Dict[str, Any]) -> None:
-            if item.get('type') == element_name:
-                dependents.append(item.get('name', 'unknown'))
+        def index_dependencies(item: Dict[str, Any]) -> None:
+            dependents[item.get('type')].append(item.get('name', 'unknown'))
             
             for child in item.get('children', []):
-                check_dependencies(child)
+                index_dependencies(child)
         
         # Check root elements
         elements = self.structure['elements']
         if isinstance(elements, dict):
             for element in elements.values():
-                check_dependencies(element)
+                index_dependencies(element)
         else:
             for element in elements:
-                check_dependencies(element)
+                index_dependencies(element)
         
         # Check global elements
         for element in self.structure['global_elements'].values():
-            check_dependencies(element)
+            index_dependencies(element)
         
         # Check complex types
         for complex_type in self.structure['complex_types'].values():
             for element in complex_type.get('elements', []):
-                check_dependencies(element)
+                index_dependencies(element)
         
-        return list(set(dependents))
+        return dependents
+    
+    def _find_element_dependents(self, element_name: str) -> List[str]:
+        """Find what depends on this element."""
+        # One index lookup instead of rescanning the whole schema per element page
+        return list(set(self._dependents_by_type.get(element_name, ())))
     
     def _get_dependency_type(self, source: str, target: str) -> str:
         """Determine the type of dependency relationship."""
@@ -277,18 +297,28 @@ class HTMLGenerator:
         else:
             return f"min: {min_occurs}, max: {max_occurs}"
     
+    @cached_property
+    def _type_names(self) -> frozenset:
+        """Names of all complex and simple types, for type-page links."""
+        return frozenset(self.structure['complex_types']).union(self.structure['simple_types'])
+    
     def _get_type_link(self, type_name: str) -> str:
         """Generate a link to a type page."""
         if not type_name:
             return ""
         
-        # Remove namespace prefix for cleaner links
-        clean_name = type_name.split(':')[-1]
-        
-        if type_name in self.structure['complex_types'] or type_name in self.structure['simple_types']:
-            return f"types/{clean_name}.html"
-        else:
-            return f"elements/{clean_name}.html"
+        # The filter runs for every type cell in every page; each name is resolved once
+        link = self._type_links.get(type_name)
+        if link is None:
+            # Remove namespace prefix for cleaner links
+            clean_name = type_name.rpartition(':')[2]
+            
+            if type_name in self._type_names:
+                link = f"types/{clean_name}.html"
+            else:
+                link = f"elements/{clean_name}.html"
+            self._type_links[type_name] = link
+        return link
     
     def _format_documentation(self, doc: Optional[str]) -> str:
         """Format documentation text for HTML display."""
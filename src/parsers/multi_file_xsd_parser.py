@@ -9,13 +9,22 @@ from typing import Dict, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 import logging
-from lxml import etree
 from lxml.etree import _Element
 
-from .xsd_parser import XSDParser, XSDElement, XSDComplexType, XSDSimpleType
+from .xsd_parser import XSDParser, XSDElement, XSDComplexType, XSDSimpleType, _parse_xml_file
 
 logger = logging.getLogger(__name__)
 
+# Component tables that a root added with add_schema_file may not redefine
+_ROOT_PROTECTED_TABLES = ('simple_types', 'global_attributes', 'attribute_groups',
+                          'complex_types', 'global_elements')
+
+def _without_source(definition: Any) -> Any:
+    """Drop the per-file source_file entry so definitions from different files compare equal."""
+    if isinstance(definition, dict):
+        return {key: value for key, value in definition.items() if key != 'source_file'}
+    return definition
+
 @dataclass
 class SchemaReference:
     """Represents a reference to another schema file."""
@@ -43,6 +52,7 @@ class MultiFileXSDParser(XSDParser):
         self.imported_namespaces: Dict[str, str] = {}  # namespace -> file path
         self.all_roots: Dict[str, _Element] = {}  # file path -> root element
         self.file_dependencies: Dict[str, List[str]] = {}  # file -> list of dependent files
+        self.added_root_files: Set[str] = set()  # files loaded only through add_schema_file
         
         # Initialize base parser
         super().__init__(xsd_path)
@@ -82,12 +92,8 @@ class MultiFileXSDParser(XSDParser):
         logger.info(f"Loading schema file: {file_path}")
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
             # Parse with lxml
-            parser = etree.XMLParser(recover=True)
-            root = etree.fromstring(content.encode('utf-8'), parser)
+            root = _parse_xml_file(file_path)
             
             # Store root element
             self.all_roots[str(file_path)] = root
@@ -219,6 +225,27 @@ class MultiFileXSDParser(XSDParser):
                 if ref.resolved_path and ref.resolved_path not in self.processed_files:
                     self._load_schema_file(ref.resolved_path)
     
+    def add_schema_file(self, xsd_path: str) -> None:
+        """
+        Load another root schema file and everything it references.
+        
+        Files already loaded (directly or through an import/include) are skipped,
+        so schemas shared between several roots are only read and parsed once.
+        Components from the added files never replace ones already defined by
+        the main schema or an earlier root; conflicting names are logged.
+        
+        Args:
+            xsd_path: Path to the additional XSD file
+        """
+        file_path = Path(xsd_path).resolve()
+        if file_path in {Path(loaded).resolve() for loaded in self.all_roots}:
+            return
+        
+        loaded_before = set(self.all_roots)
+        self._load_schema_file(file_path)
+        self._process_schema_references()
+        self.added_root_files.update(set(self.all_roots) - loaded_before)
+    
     def parse(self) -> Dict[str, Any]:
         """
         Parse the multi-file XSD schema and extract all components.
@@ -251,6 +278,11 @@ class MultiFileXSDParser(XSDParser):
         for file_path, root in self.all_roots.items():
             logger.info(f"Parsing components from {file_path}")
             
+            # Snapshot definitions an added root must not replace
+            existing = None
+            if file_path in self.added_root_files:
+                existing = {table: dict(getattr(self, table)) for table in _ROOT_PROTECTED_TABLES}
+            
             # Temporarily set root to parse this file
             original_root = self.root
             self.root = root
@@ -270,6 +302,23 @@ class MultiFileXSDParser(XSDParser):
             finally:
                 # Restore original root
                 self.root = original_root
+            
+            if existing is not None:
+                self._keep_existing_definitions(file_path, existing)
+    
+    def _keep_existing_definitions(self, file_path: str, existing: Dict[str, Dict[str, Any]]) -> None:
+        """Undo redefinitions made while parsing an added root file, warning where they differ."""
+        for table, previous in existing.items():
+            current = getattr(self, table)
+            for name, definition in previous.items():
+                replacement = current[name]
+                if replacement is definition:
+                    continue
+                current[name] = definition
+                if _without_source(replacement) != _without_source(definition):
+                    kind = table[:-1].replace('_', ' ')
+                    logger.warning(f"{Path(file_path).name} redefines {kind} '{name}'; "
+                                   f"keeping the earlier definition")
     
     def _parse_simple_types_from_file(self, file_path: str) -> None:
         """Parse simple types from a specific file."""
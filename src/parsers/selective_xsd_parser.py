@@ -4,8 +4,13 @@ Allows cherry-picking elements, types, or entire namespaces from different schem
 """
 
 import os
+import sys
+import hashlib
 import logging
-from typing import Dict, List, Any, Optional, Set, Union
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import Dict, List, Any, Optional, Set, Tuple, Union
 from pathlib import Path
 from dataclasses import dataclass
 from lxml import etree
@@ -36,23 +41,114 @@ class SelectedComponent:
     component_data: Union[XSDElement, XSDComplexType, XSDSimpleType]
     dependencies: Set[str]
 
+# Component keys whose values repeat heavily across a schema (namespace URIs,
+# built-in type names, occurrence bounds)
+_INTERN_KEYS = frozenset({'namespace', 'type', 'base_type', 'min_occurs', 'max_occurs', 'use'})
+
+def _intern_strings(component: Dict[str, Any]) -> None:
+    """Intern repeated string values in a component dict and its nested elements/attributes, in place."""
+    stack = [component]
+    while stack:
+        item = stack.pop()
+        for key, value in item.items():
+            if isinstance(value, str):
+                if key in _INTERN_KEYS:
+                    item[key] = sys.intern(value)
+            elif isinstance(value, list):
+                stack.extend(v for v in value if isinstance(v, dict))
+            elif isinstance(value, dict):
+                stack.append(value)
+
+# Parser modules whose code shapes a cached parse result
+_PARSER_SOURCES = ('xsd_parser.py', 'multi_file_xsd_parser.py', 'selective_xsd_parser.py')
+
+@lru_cache(maxsize=None)
+def _parser_fingerprint() -> str:
+    """Identify the parser code, Python and lxml versions a cache entry was built with."""
+    digest = hashlib.sha1(f"{sys.version_info[:2]}|{etree.LXML_VERSION}".encode('utf-8'))
+    parser_dir = Path(__file__).parent
+    for name in _PARSER_SOURCES:
+        digest.update((parser_dir / name).read_bytes())
+    return digest.hexdigest()
+
+def _file_stamps(paths) -> Dict[str, Tuple[int, int]]:
+    """Return (mtime_ns, size) for each path; raises OSError if one is missing."""
+    stamps = {}
+    for path in paths:
+        stat = os.stat(path)
+        stamps[path] = (stat.st_mtime_ns, stat.st_size)
+    return stamps
+
+def _cache_file(cache_dir: str, file_path: str) -> Path:
+    """Return the cache entry path for a schema file."""
+    digest = hashlib.sha1(os.path.abspath(file_path).encode('utf-8')).hexdigest()
+    return Path(cache_dir) / f"{digest}.pkl"
+
+def _load_cached_schema(cache_file: Path) -> Optional[Tuple[Dict[str, Any], Optional[str]]]:
+    """Return a cached parse result if every schema file it was built from is unchanged."""
+    try:
+        with open(cache_file, 'rb') as f:
+            fingerprint, stamps, result = pickle.load(f)
+        if fingerprint != _parser_fingerprint() or _file_stamps(stamps) != stamps:
+            return None
+        return result
+    except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+        return None
+
+def _store_cached_schema(cache_file: Path, parser: MultiFileXSDParser,
+                         result: Tuple[Dict[str, Any], Optional[str]]) -> None:
+    """Pickle a parse result with the stamps of all schema files the parser loaded; failures only warn."""
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, 'wb') as f:
+            pickle.dump((_parser_fingerprint(), _file_stamps(parser.all_roots), result), f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError, RecursionError) as e:
+        logger.warning(f"Could not write parse cache {cache_file}: {e}")
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
+
+def _parse_schema(file_path: str, cache_dir: Optional[str] = None) -> Tuple[Dict[str, Any], Optional[str]]:
+    """Parse one XSD file with its references, returning (structure, target namespace); runs in worker processes."""
+    cache_file = _cache_file(cache_dir, file_path) if cache_dir else None
+    if cache_file is not None:
+        cached = _load_cached_schema(cache_file)
+        if cached is not None:
+            logger.debug(f"Using cached parse of {file_path}")
+            return cached
+    
+    parser = MultiFileXSDParser(file_path)
+    result = (parser.parse(), parser.target_namespace)
+    if cache_file is not None:
+        _store_cached_schema(cache_file, parser, result)
+    return result
+
 class SelectiveXSDParser:
     """
     Parser that can extract and analyze specific components from multiple XSD files.
     """
     
-    def __init__(self, base_dir: Optional[str] = None):
+    def __init__(self, base_dir: Optional[str] = None, cache_dir: Optional[str] = None):
         """
         Initialize selective parser.
         
         Args:
             base_dir: Base directory for resolving relative paths
+            cache_dir: Directory for pickled parse results, reused while the schema files and
+                       parser are unchanged. Entries are unpickled, so only use a directory
+                       that no one else can write to.
         """
         self.base_dir = Path(base_dir) if base_dir else Path.cwd()
+        self.cache_dir = str(cache_dir) if cache_dir else None
         self.selection_criteria: List[SelectionCriteria] = []
         self.selected_components: Dict[str, SelectedComponent] = {}
         self.parsers: Dict[str, MultiFileXSDParser] = {}  # file_path -> parser
         self.dependency_map: Dict[str, Set[str]] = {}
+        self._selection_summary: Optional[Dict[str, Any]] = None
         
     def add_selection(self, criteria: SelectionCriteria) -> None:
         """Add selection criteria for a specific file."""
@@ -87,18 +183,53 @@ class SelectiveXSDParser:
         )
         self.add_selection(criteria)
     
-    def parse_selections(self) -> Dict[str, Any]:
+    def parse_selections(self, jobs: int = 1) -> Dict[str, Any]:
         """
         Parse all selected components from specified files.
         
+        Args:
+            jobs: Worker processes for parsing distinct files (1 parses serially, 0 uses all CPUs).
+                  Parsers are not kept in self.parsers when files are parsed in workers or loaded from cache_dir.
+        
         Returns:
             Combined structure containing only selected components
         """
         logger.info(f"Starting selective parsing of {len(self.selection_criteria)} selections...")
+        self._selection_summary = None
+        
+        if jobs == 0:
+            jobs = os.cpu_count() or 1
+        # Each distinct existing file is parsed once, however many selections name it
+        file_paths = list(dict.fromkeys(
+            path for path in (self._resolve_file_path(c) for c in self.selection_criteria)
+            if Path(path).exists()
+        ))
+        jobs = min(jobs, len(file_paths))
         
-        # Parse each file and extract selected components
-        for criteria in self.selection_criteria:
-            self._parse_file_selection(criteria)
+        if jobs > 1:
+            # Files are parsed independently, so spread them across worker
+            # processes and extract the selections in order afterwards.
+            # Cached parses load faster in-process than through a worker.
+            parsed = self._load_cached_schemas(file_paths)
+            missing = [path for path in file_paths if path not in parsed]
+            workers = min(jobs, len(missing))
+            if workers > 1:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    parsed.update(zip(missing, executor.map(partial(_parse_schema, cache_dir=self.cache_dir), missing)))
+            else:
+                parsed.update((path, _parse_schema(path, self.cache_dir)) for path in missing)
+                
+            for criteria in self.selection_criteria:
+                file_path = self._resolve_file_path(criteria)
+                if file_path not in parsed:
+                    logger.error(f"File not found: {file_path}")
+                    continue
+                structure, namespace = parsed[file_path]
+                self._extract_selections(criteria, structure, namespace)
+        else:
+            # Parse each file and extract selected components
+            for criteria in self.selection_criteria:
+                self._parse_file_selection(criteria)
         
         # Resolve dependencies if requested
         self._resolve_dependencies()
@@ -109,9 +240,35 @@ class SelectiveXSDParser:
         logger.info(f"Selective parsing complete. Selected {len(self.selected_components)} components.")
         return structure
     
+    def _load_cached_schemas(self, file_paths: List[str]) -> Dict[str, Tuple[Dict[str, Any], Optional[str]]]:
+        """Return the still-valid cached parses among file_paths, keyed by path."""
+        if not self.cache_dir:
+            return {}
+        cached = {}
+        for file_path in file_paths:
+            result = _load_cached_schema(_cache_file(self.cache_dir, file_path))
+            if result is not None:
+                logger.debug(f"Using cached parse of {file_path}")
+                cached[file_path] = result
+        return cached
+    
+    def clear_intermediate_buffers(self) -> None:
+        """
+        Drop per-file parsers (lxml trees and full parsed structures) kept by serial parsing.
+        
+        The combined structure returned by parse_selections() and the selection
+        summary do not depend on them.
+        """
+        self.parsers.clear()
+        self.dependency_map.clear()
+    
+    def _resolve_file_path(self, criteria: SelectionCriteria) -> str:
+        """Return the path of a selection's file relative to the base directory."""
+        return str(self.base_dir / criteria.file_path)
+    
     def _parse_file_selection(self, criteria: SelectionCriteria) -> None:
         """Parse and extract selected components from a single file."""
-        file_path = str(self.base_dir / criteria.file_path)
+        file_path = self._resolve_file_path(criteria)
         
         if not Path(file_path).exists():
             logger.error(f"File not found: {file_path}")
@@ -119,30 +276,40 @@ class SelectiveXSDParser:
         
         logger.info(f"Parsing selections from {file_path}")
         
+        if self.cache_dir:
+            structure, namespace = _parse_schema(file_path, self.cache_dir)
+            self._extract_selections(criteria, structure, namespace)
+            return
+        
         # Create parser for this file
         parser = MultiFileXSDParser(file_path)
         self.parsers[file_path] = parser
         
         # Parse the file
         structure = parser.parse()
-        
+        self._extract_selections(criteria, structure, parser.target_namespace)
+    
+    def _extract_selections(self, criteria: SelectionCriteria,
+                            structure: Dict[str, Any],
+                            target_namespace: Optional[str]) -> None:
+        """Extract the components a selection asks for from a parsed file structure."""
         # Extract selected elements
         if criteria.elements:
-            self._extract_selected_elements(parser, criteria, structure)
+            self._extract_selected_elements(target_namespace, criteria, structure)
         
         # Extract selected complex types
         if criteria.complex_types:
-            self._extract_selected_complex_types(parser, criteria, structure)
+            self._extract_selected_complex_types(target_namespace, criteria, structure)
             
         # Extract selected simple types
         if criteria.simple_types:
-            self._extract_selected_simple_types(parser, criteria, structure)
+            self._extract_selected_simple_types(target_namespace, criteria, structure)
         
         # Extract by namespace
         if criteria.namespaces:
-            self._extract_by_namespace(parser, criteria, structure)
+            self._extract_by_namespace(target_namespace, criteria, structure)
     
-    def _extract_selected_elements(self, parser: MultiFileXSDParser, 
+    def _extract_selected_elements(self, target_namespace: Optional[str], 
                                  criteria: SelectionCriteria, 
                                  structure: Dict[str, Any]) -> None:
         """Extract specific elements from parsed structure."""
@@ -157,7 +324,7 @@ class SelectiveXSDParser:
                     name=element_name,
                     component_type='element',
                     source_file=criteria.file_path,
-                    namespace=parser.target_namespace,
+                    namespace=target_namespace,
                     component_data=element_data,
                     dependencies=self._find_element_dependencies(element_data)
                 )
@@ -165,7 +332,7 @@ class SelectiveXSDParser:
                 self.selected_components[f"element:{element_name}"] = selected
                 logger.debug(f"Selected element: {element_name} from {criteria.file_path}")
     
-    def _extract_selected_complex_types(self, parser: MultiFileXSDParser,
+    def _extract_selected_complex_types(self, target_namespace: Optional[str],
                                       criteria: SelectionCriteria,
                                       structure: Dict[str, Any]) -> None:
         """Extract specific complex types from parsed structure."""
@@ -180,7 +347,7 @@ class SelectiveXSDParser:
                     name=type_name,
                     component_type='complex_type',
                     source_file=criteria.file_path,
-                    namespace=parser.target_namespace,
+                    namespace=target_namespace,
                     component_data=type_data,
                     dependencies=self._find_type_dependencies(type_data)
                 )
@@ -188,7 +355,7 @@ class SelectiveXSDParser:
                 self.selected_components[f"complex_type:{type_name}"] = selected
                 logger.debug(f"Selected complex type: {type_name} from {criteria.file_path}")
     
-    def _extract_selected_simple_types(self, parser: MultiFileXSDParser,
+    def _extract_selected_simple_types(self, target_namespace: Optional[str],
                                      criteria: SelectionCriteria,
                                      structure: Dict[str, Any]) -> None:
         """Extract specific simple types from parsed structure."""
@@ -203,7 +370,7 @@ class SelectiveXSDParser:
                     name=type_name,
                     component_type='simple_type',
                     source_file=criteria.file_path,
-                    namespace=parser.target_namespace,
+                    namespace=target_namespace,
                     component_data=type_data,
                     dependencies=set()  # Simple types typically have fewer dependencies
                 )
@@ -211,55 +378,57 @@ class SelectiveXSDParser:
                 self.selected_components[f"simple_type:{type_name}"] = selected
                 logger.debug(f"Selected simple type: {type_name} from {criteria.file_path}")
     
-    def _extract_by_namespace(self, parser: MultiFileXSDParser,
+    def _extract_by_namespace(self, target_namespace: Optional[str],
                             criteria: SelectionCriteria,
                             structure: Dict[str, Any]) -> None:
         """Extract all components from specific namespaces."""
         if not criteria.namespaces:
             return
             
-        for namespace in criteria.namespaces:
-            # Handle wildcard for "all namespaces"
-            if namespace == "*" or namespace == parser.target_namespace:
-                # Include all components from this file/namespace
-                for name, element in structure.get('global_elements', {}).items():
-                    key = f"element:{name}"
-                    if key not in self.selected_components:
-                        selected = SelectedComponent(
-                            name=name,
-                            component_type='element',
-                            source_file=criteria.file_path,
-                            namespace=parser.target_namespace,
-                            component_data=element,
-                            dependencies=self._find_element_dependencies(element)
-                        )
-                        self.selected_components[key] = selected
-                
-                for name, ctype in structure.get('complex_types', {}).items():
-                    key = f"complex_type:{name}"
-                    if key not in self.selected_components:
-                        selected = SelectedComponent(
-                            name=name,
-                            component_type='complex_type',
-                            source_file=criteria.file_path,
-                            namespace=parser.target_namespace,
-                            component_data=ctype,
-                            dependencies=self._find_type_dependencies(ctype)
-                        )
-                        self.selected_components[key] = selected
-                
-                for name, stype in structure.get('simple_types', {}).items():
-                    key = f"simple_type:{name}"
-                    if key not in self.selected_components:
-                        selected = SelectedComponent(
-                            name=name,
-                            component_type='simple_type',
-                            source_file=criteria.file_path,
-                            namespace=parser.target_namespace,
-                            component_data=stype,
-                            dependencies=set()
-                        )
-                        self.selected_components[key] = selected
+        # Handle wildcard for "all namespaces"; the file is walked once however many entries match
+        namespaces = frozenset(criteria.namespaces)
+        if "*" not in namespaces and target_namespace not in namespaces:
+            return
+        
+        # Include all components from this file/namespace
+        for name, element in structure.get('global_elements', {}).items():
+            key = f"element:{name}"
+            if key not in self.selected_components:
+                selected = SelectedComponent(
+                    name=name,
+                    component_type='element',
+                    source_file=criteria.file_path,
+                    namespace=target_namespace,
+                    component_data=element,
+                    dependencies=self._find_element_dependencies(element)
+                )
+                self.selected_components[key] = selected
+        
+        for name, ctype in structure.get('complex_types', {}).items():
+            key = f"complex_type:{name}"
+            if key not in self.selected_components:
+                selected = SelectedComponent(
+                    name=name,
+                    component_type='complex_type',
+                    source_file=criteria.file_path,
+                    namespace=target_namespace,
+                    component_data=ctype,
+                    dependencies=self._find_type_dependencies(ctype)
+                )
+                self.selected_components[key] = selected
+        
+        for name, stype in structure.get('simple_types', {}).items():
+            key = f"simple_type:{name}"
+            if key not in self.selected_components:
+                selected = SelectedComponent(
+                    name=name,
+                    component_type='simple_type',
+                    source_file=criteria.file_path,
+                    namespace=target_namespace,
+                    component_data=stype,
+                    dependencies=set()
+                )
+                self.selected_components[key] = selected
     
     def _find_element_dependencies(self, element: XSDElement) -> Set[str]:
         """Find dependencies for an element."""
@@ -311,6 +480,8 @@ class SelectiveXSDParser:
         # Group components by type 
         for key, component in self.selected_components.items():
             component_data = component.component_data  # type: ignore
+            # Parses from worker processes or the cache carry their own copies of every string
+            _intern_strings(component_data)  # type: ignore
             if component.component_type == 'element':
                 # component_data is already a dict from the parser
                 element_dict = {**component_data, 'source_file': component.source_file}  # type: ignore
@@ -338,7 +509,9 @@ class SelectiveXSDParser:
         return combined
     
     def get_selection_summary(self) -> Dict[str, Any]:
-        """Get a summary of all selections made."""
+        """Get a summary of all selections made; cached until the next parse_selections()."""
+        if self._selection_summary is not None:
+            return self._selection_summary
         summary = {}
         
         for file_path in set(comp.source_file for comp in self.selected_components.values()):
@@ -353,4 +526,5 @@ class SelectiveXSDParser:
                 'namespaces': list(set(c.namespace for c in file_components if c.namespace))
             }
         
+        self._selection_summary = summary
         return summary
@@ -14,6 +14,18 @@ from lxml.etree import _Element
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _parse_xml_file(path) -> Optional[_Element]:
+    """
+    Parse an XML file into its root element with lxml.
+    
+    The raw bytes go straight to libxml2, so there is no decode/re-encode round
+    trip and the file's own encoding declaration is honoured.
+    """
+    with open(path, 'rb') as f:
+        content = f.read()
+    parser = etree.XMLParser(recover=True)
+    return etree.fromstring(content, parser)
+
 @dataclass
 class XSDElement:
     """Represents an XSD element with its properties and relationships."""
@@ -91,12 +103,8 @@ class XSDParser:
     def _load_schema(self) -> None:
         """Load and parse the XSD file."""
         try:
-            with open(self.xsd_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
             # Parse with lxml for better performance
-            parser = etree.XMLParser(recover=True)
-            self.root = etree.fromstring(content.encode('utf-8'), parser)
+            self.root = _parse_xml_file(self.xsd_path)
             
             # Validate that parsing was successful
             if self.root is None: